@@ -1,5 +1,6 @@
 import json
 import asyncio
+import sys
 import time
 from typing import Dict, List, Optional, TypedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -11,7 +12,7 @@ from news_portal.config import (
     TOPIC, SUBTOPICS, SUBTOPIC_DESCRIPTIONS,
     NEWS_ARTICLE_COUNT, RESULT_FILE, SEARCH_DAYS_FRESH, SEARCH_DAYS_EXTEND
 )
-from news_portal.tools import fetch_articles_with_content
+from news_portal.tools import fetch_articles_with_content, prefetch_news_searches
 from news_portal.agents import (
     llm, SUMMARY_PROMPT, EDITORIAL_PROMPT, MAJOR_EDITORIAL_PROMPT, QUALITY_PROMPT,
     BATCH_SUMMARY_PROMPT, BATCH_QUALITY_PROMPT, QualityAssessmentTD,
@@ -268,13 +269,23 @@ def process_all_subtopics(state: PortalState) -> PortalState:
         ],
     }
     
-    # Process subtopics in parallel with randomized query selection
+    # Randomly select 3 queries from the 4 available to add variety
+    selected_queries = {
+        subtopic: random.sample(queries, min(3, len(queries)))
+        for subtopic, queries in subtopic_queries.items()
+    }
+    
+    # Issue every subtopic's searches at once; the subtopic workers below then hit the search cache
+    search_start = time.time()
+    prefetch_news_searches([q for queries in selected_queries.values() for q in queries], days_hint=SEARCH_DAYS_FRESH)
+    print(f"🔍 Searches for all subtopics completed in {time.time() - search_start:.2f}s")
+    
+    # Process subtopics in parallel
     with ThreadPoolExecutor(max_workers=3) as executor:  # Limit to avoid rate limits
-        future_to_subtopic = {}
-        for subtopic, queries in subtopic_queries.items():
-            # Randomly select 3 queries from the 4 available to add variety
-            selected_queries = random.sample(queries, min(3, len(queries)))
-            future_to_subtopic[executor.submit(process_subtopic_parallel, subtopic, selected_queries, want)] = subtopic
+        future_to_subtopic = {
+            executor.submit(process_subtopic_parallel, subtopic, queries, want): subtopic
+            for subtopic, queries in selected_queries.items()
+        }
         
         for future in as_completed(future_to_subtopic):
             subtopic = future_to_subtopic[future]
@@ -428,6 +439,14 @@ async def chief_editor_async(state: PortalState) -> PortalState:
     except Exception as e:
         print(f"⚠️ Glossary generation error: {e}")
         glossary_data = None
+    finally:
+        # Both MCP calls above share one session; release it before the loop ends
+        from news_portal.mcp_client_service import close_shared_service
+        await close_shared_service()
+        # Same for the per-loop image client, if the MCP tools ran in this process
+        tools_base = sys.modules.get("news_portal.mcp_tools.mcp_tools_base")
+        if tools_base is not None:
+            await tools_base.close_image_http_client()
     
     state["home"] = {
         "best_articles": best_articles,  # Show one article from each subtopic (5 total)
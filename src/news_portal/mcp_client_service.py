@@ -11,27 +11,167 @@ The MCP tool handles:
 """
 
 import asyncio
+import copy
+import hashlib
 import logging
-import json
+import anyio
+import httpx
+import orjson
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from cachetools import TTLCache
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
 
 # Use the fastmcp client directly since we know it works
 from fastmcp import Client
+from fastmcp.client.transports import StreamableHttpTransport
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the MCP HTTP transport. Kept-alive connections are reused
+# for every call_tool() on a session instead of reconnecting per request.
+MCP_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+MCP_CONNECT_TIMEOUT_SECONDS = 5.0
+
+def _mcp_http_client_factory(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None,
+) -> httpx.AsyncClient:
+    """Build the pooled httpx client used by the MCP transport."""
+    # Keep the transport's read timeout (image generation can take minutes),
+    # but fail fast when the server isn't reachable
+    timeout = timeout or httpx.Timeout(30.0)
+    return httpx.AsyncClient(
+        headers=headers,
+        auth=auth,
+        follow_redirects=True,
+        limits=MCP_HTTP_LIMITS,
+        timeout=httpx.Timeout(
+            connect=MCP_CONNECT_TIMEOUT_SECONDS,
+            read=timeout.read,
+            write=timeout.write,
+            pool=timeout.pool,
+        ),
+    )
+
+# Shared service reused by the convenience functions. The underlying MCP session
+# is bound to the event loop that opened it, so it is tracked per loop.
+_shared_service: Optional["MCPClientService"] = None
+_shared_service_loop: Optional[asyncio.AbstractEventLoop] = None
+_service_lock: Optional[asyncio.Lock] = None
+# Bumped each time get_shared() opens a session, so a caller holding a failed
+# session can tell whether someone else has already replaced it
+_shared_generation = 0
+
+# Successful glossary results keyed by (server, domain, max_terms, min_centrality).
+# The glossary only changes when the server's knowledge graph is rebuilt.
+GLOSSARY_CACHE_MAXSIZE = 64
+GLOSSARY_CACHE_TTL_SECONDS = 600
+_glossary_cache: TTLCache = TTLCache(maxsize=GLOSSARY_CACHE_MAXSIZE, ttl=GLOSSARY_CACHE_TTL_SECONDS)
+
+# Upper bound on a single MCP tool call; cover generation (DALL-E + upload) is the slowest.
+# Kept above the server's own 300s tool limit, so a slow call fails on the server first.
+TOOL_CALL_TIMEOUT_SECONDS = 330
+
+# Retry policy for transient transport failures on MCP tool calls. Timeouts are
+# never retried: the server may still be running the first (paid) generation.
+TOOL_CALL_ATTEMPTS = 3
+TOOL_CALL_RETRY_MAX_WAIT_SECONDS = 8
+_RETRYABLE_ERRORS = (httpx.TransportError, ConnectionError)
+
+def _is_retryable(error: BaseException) -> bool:
+    return isinstance(error, _RETRYABLE_ERRORS) and not isinstance(error, httpx.TimeoutException)
+
+# Failures that mean the session itself is dead, as opposed to one tool call
+# failing or timing out; only these make the shared session reconnect
+_SESSION_ERRORS = (httpx.TransportError, ConnectionError, anyio.ClosedResourceError, anyio.BrokenResourceError)
+
+def _is_session_error(error: BaseException) -> bool:
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return isinstance(error, _SESSION_ERRORS) and not isinstance(error, httpx.TimeoutException)
+
+class _CircuitBreaker:
+    """Stops calling the MCP server for reset_timeout seconds after fail_max failed calls in a row."""
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.open_until = 0.0
+    
+    def is_open(self) -> bool:
+        return self.failures >= self.fail_max and time.monotonic() < self.open_until
+    
+    def record_success(self) -> None:
+        self.failures = 0
+    
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            self.open_until = time.monotonic() + self.reset_timeout
+
+_tool_breaker = _CircuitBreaker()
+
+# Manifest of covers already generated and uploaded, keyed by request hash.
+# Cloudinary holds the canonical copy, so entries only need its URL; the
+# manifest lives in the user cache dir so it does not depend on the CWD.
+COVER_MANIFEST_FILE = Path.home() / ".cache" / "news_portal" / "cover_manifest.json"
+
+def _cover_request_key(editorial_text: str, domain: str, style: str, dimensions: str) -> str:
+    """Hash of the cover request payload."""
+    payload = {"t": editorial_text, "d": domain, "s": style, "dim": dimensions}
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def _load_cover_manifest() -> Dict[str, Dict[str, Optional[str]]]:
+    try:
+        return orjson.loads(COVER_MANIFEST_FILE.read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+def _lookup_cached_cover(request_key: str) -> Optional[Dict[str, Optional[str]]]:
+    """Return the manifest entry for a request, dropping a local path that no longer exists."""
+    entry = _load_cover_manifest().get(request_key)
+    if not entry or not entry.get("cloudinary_url"):
+        return None
+    if entry.get("path") and not Path(entry["path"]).exists():
+        entry["path"] = None
+    return entry
+
+def _record_cover(request_key: str, cloudinary_url: str, local_path: Optional[str] = None) -> None:
+    """Add an uploaded cover to the manifest."""
+    try:
+        manifest = _load_cover_manifest()
+        manifest[request_key] = {
+            "cloudinary_url": cloudinary_url,
+            "path": local_path,
+        }
+        COVER_MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+        COVER_MANIFEST_FILE.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    except Exception as e:
+        logger.warning(f"⚠️ Could not update cover manifest: {e}")
+
 class MCPClientService:
     """Service to interact with MCP tools for cover image generation."""
     
     def __init__(self, mcp_server_url: str = "http://localhost:8002"):
         self.mcp_server_url = mcp_server_url
         self.client = None
+        self.generation: Optional[int] = None
     
     async def __aenter__(self):
         """Async context manager entry."""
         # Use the fastmcp client directly
-        self.client = Client(f"{self.mcp_server_url}/mcp")
+        transport = StreamableHttpTransport(
+            f"{self.mcp_server_url}/mcp",
+            httpx_client_factory=_mcp_http_client_factory,
+        )
+        self.client = Client(transport)
         await self.client.__aenter__()
         return self
     
@@ -40,11 +180,104 @@ class MCPClientService:
         if self.client:
             await self.client.__aexit__(exc_type, exc_val, exc_tb)
     
+    @classmethod
+    async def get_shared(cls, mcp_server_url: str = "http://localhost:8002") -> "MCPClientService":
+        """
+        Return a connected service shared by all callers on the running event loop.
+        
+        The MCP session (HTTP connection + handshake) is opened once and reused
+        until close_shared_service() is called or a new event loop is started.
+        """
+        global _shared_service, _shared_service_loop, _service_lock, _shared_generation
+        
+        loop = asyncio.get_running_loop()
+        if _shared_service_loop is not loop:
+            # A session opened on a previous (now finished) loop cannot be reused
+            _shared_service = None
+            _shared_service_loop = loop
+            _service_lock = asyncio.Lock()
+        
+        async with _service_lock:
+            if _shared_service is None:
+                service = cls(mcp_server_url)
+                await service.__aenter__()
+                _shared_generation += 1
+                service.generation = _shared_generation
+                _shared_service = service
+                logger.info(f"Opened shared MCP session to {mcp_server_url}")
+        return _shared_service
+    
+    async def _call_tool(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+        timeout_seconds: float = TOOL_CALL_TIMEOUT_SECONDS
+    ) -> Any:
+        """Call an MCP tool, retrying connection errors (never timeouts) with exponential backoff."""
+        if _tool_breaker.is_open():
+            raise RuntimeError(f"MCP server circuit open; skipping {name} call")
+        
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(TOOL_CALL_ATTEMPTS),
+                wait=wait_exponential(multiplier=0.5, max=TOOL_CALL_RETRY_MAX_WAIT_SECONDS),
+                retry=retry_if_exception(_is_retryable),
+                reraise=True
+            ):
+                with attempt:
+                    # A stalled server must not hold the caller (and a pooled connection) forever
+                    async with asyncio.timeout(timeout_seconds):
+                        result = await self.client.call_tool(name, arguments)
+        except Exception as e:
+            if isinstance(e, TimeoutError):
+                logger.error(f"❌ MCP tool {name} timed out after {timeout_seconds}s")
+            _tool_breaker.record_failure()
+            raise
+        
+        _tool_breaker.record_success()
+        return result
+    
+    async def _discard_if_shared(self, error: BaseException) -> None:
+        """Drop the shared session after a connection failure so the next caller reconnects."""
+        if not _is_session_error(error) or self.generation is None:
+            return
+        if _service_lock is None or _shared_service_loop is not asyncio.get_running_loop():
+            return
+        
+        async with _service_lock:
+            # Concurrent callers failing on the same session must close it only once,
+            # and never close the fresh session another caller has opened since
+            if self is _shared_service and self.generation == _shared_generation:
+                await close_shared_service()
+    
+    @staticmethod
+    def _parse_tool_result(result) -> Optional[Dict[str, Any]]:
+        """Decode the JSON payload of an MCP tool result, or None if unusable."""
+        # Dict-returning tools also send structured content; use it as-is
+        structured = getattr(result, "structured_content", None)
+        if isinstance(structured, dict):
+            return structured
+        
+        # Older servers only send the JSON text
+        content = getattr(result, "content", None)
+        if not content:
+            logger.error("❌ No content in MCP result")
+            return None
+        
+        result_data = content[0].text
+        try:
+            return orjson.loads(result_data)
+        except orjson.JSONDecodeError as e:
+            # Only log the head of the payload; tool results can be large
+            logger.error("❌ Failed to parse MCP result: %s (%.200s)", e, result_data)
+            return None
+    
     async def generate_glossary(
         self,
         domain: str = "cancer_care",
         max_terms: int = 20,
-        min_centrality: float = 0.1
+        min_centrality: float = 0.1,
+        timeout_seconds: float = TOOL_CALL_TIMEOUT_SECONDS
     ) -> Optional[Dict[str, Any]]:
         """
         Generate a glossary using the pre-built knowledge graph.
@@ -53,10 +286,17 @@ class MCPClientService:
             domain: Domain context (default: cancer_care)
             max_terms: Maximum number of terms to include
             min_centrality: Minimum centrality threshold
+            timeout_seconds: Time limit for each MCP call attempt
             
         Returns:
             Dictionary with glossary data or None if failed
         """
+        cache_key = (self.mcp_server_url, domain, max_terms, min_centrality)
+        cached_result = _glossary_cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"✅ Glossary cache hit for domain: {domain}")
+            return copy.deepcopy(cached_result)
+        
         try:
             if not self.client:
                 logger.error("MCP client not initialized")
@@ -65,37 +305,31 @@ class MCPClientService:
             logger.info(f"Generating glossary for domain: {domain}")
             
             # Call the MCP tool using fastmcp client
-            result = await self.client.call_tool(
+            result = await self._call_tool(
                 "build_glossary",
                 {
                     "domain": domain,
                     "max_terms": max_terms,
                     "min_centrality": min_centrality
-                }
+                },
+                timeout_seconds=timeout_seconds
             )
             
-            # Parse the result exactly like the cover image generation
-            if hasattr(result, 'content') and result.content:
-                result_data = result.content[0].text
-                try:
-                    parsed_result = json.loads(result_data)
-                    
-                    if parsed_result.get('status') == 'success':
-                        logger.info(f"✅ Glossary generated with {parsed_result.get('total_terms', 0)} terms")
-                        return parsed_result
-                    else:
-                        logger.error(f"❌ Glossary generation failed: {parsed_result.get('message')}")
-                        return None
-                        
-                except json.JSONDecodeError:
-                    logger.error(f"❌ Failed to parse MCP result: {result_data}")
-                    return None
+            parsed_result = self._parse_tool_result(result)
+            if parsed_result is None:
+                return None
+            
+            if parsed_result.get('status') == 'success':
+                logger.info(f"✅ Glossary generated with {parsed_result.get('total_terms', 0)} terms")
+                _glossary_cache[cache_key] = copy.deepcopy(parsed_result)
+                return parsed_result
             else:
-                logger.error("❌ No content in MCP result")
+                logger.error(f"❌ Glossary generation failed: {parsed_result.get('message')}")
                 return None
                 
         except Exception as e:
             logger.error(f"❌ Glossary generation error: {e}")
+            await self._discard_if_shared(e)
             return None
     
     async def generate_portal_cover_image(
@@ -103,7 +337,8 @@ class MCPClientService:
         editorial_text: str, 
         domain: str = "cancer_care",
         style: str = "professional",
-        dimensions: str = "1792x1024"
+        dimensions: str = "1792x1024",
+        timeout_seconds: float = TOOL_CALL_TIMEOUT_SECONDS
     ) -> Optional[Dict[str, Any]]:
         """
         Generate a portal cover image for the main editorial.
@@ -113,6 +348,7 @@ class MCPClientService:
             domain: Domain context (default: cancer_care)
             style: Image style (default: professional)
             dimensions: Image dimensions (default: 1792x1024 for portal cover)
+            timeout_seconds: Time limit for each MCP call attempt
             
         Returns:
             Dictionary with image data or None if failed
@@ -122,10 +358,26 @@ class MCPClientService:
                 logger.error("MCP client not initialized")
                 return None
             
+            # Reuse a cover already generated and uploaded for the same request
+            request_key = _cover_request_key(editorial_text, domain, style, dimensions)
+            cached_cover = _lookup_cached_cover(request_key)
+            if cached_cover:
+                logger.info(f"✅ Reusing cached portal cover: {cached_cover['cloudinary_url']}")
+                return {
+                    "status": "success",
+                    "image_url": cached_cover["cloudinary_url"],
+                    "cloudinary_url": cached_cover["cloudinary_url"],
+                    "local_path": cached_cover["path"],
+                    "local_image_path": cached_cover["path"],
+                    "dimensions": dimensions,
+                    "style": style,
+                    "cached": True
+                }
+            
             logger.info(f"Generating portal cover for domain: {domain} with dimensions: {dimensions}")
             
             # Call the MCP tool using fastmcp client
-            result = await self.client.call_tool(
+            result = await self._call_tool(
                 "generate_cover_image",
                 {
                     "editorial_text": editorial_text,
@@ -133,49 +385,68 @@ class MCPClientService:
                     "style": style,
                     "dimensions": dimensions,
                     "image_engine": "dall-e-3"
-                }
+                },
+                timeout_seconds=timeout_seconds
             )
             
-            # Parse the result exactly like the test script
-            if hasattr(result, 'content') and result.content:
-                result_data = result.content[0].text
-                try:
-                    parsed_result = json.loads(result_data)
-                    
-                    if parsed_result.get('status') == 'success':
-                        # The MCP tool now handles everything:
-                        # - Generates image via DALL-E
-                        # - Saves locally to generated_images/ folder
-                        # - Uploads to Cloudinary
-                        # - Returns Cloudinary URL as primary URL
-                        
-                        cloudinary_url = parsed_result.get('image_url')
-                        local_path = parsed_result.get('local_path')
-                        
-                        logger.info(f"✅ Portal cover generated")
-                        logger.info(f"   Cloudinary URL: {cloudinary_url}")
-                        logger.info(f"   Local path: {local_path}")
-                        
-                        # Add explicit fields for clarity
-                        parsed_result['cloudinary_url'] = cloudinary_url
-                        parsed_result['local_image_path'] = local_path
-                        
-                        return parsed_result
-                    else:
-                        logger.error(f"❌ Portal cover generation failed: {parsed_result.get('message')}")
-                        return None
-                        
-                except json.JSONDecodeError:
-                    logger.error(f"❌ Failed to parse MCP result: {result_data}")
-                    return None
+            parsed_result = self._parse_tool_result(result)
+            if parsed_result is None:
+                return None
+            
+            if parsed_result.get('status') == 'success':
+                # The MCP tool now handles everything:
+                # - Generates image via DALL-E
+                # - Saves locally to generated_images/ folder
+                # - Uploads to Cloudinary
+                # - Returns Cloudinary URL as primary URL
+                
+                cloudinary_url = parsed_result.get('image_url')
+                local_path = parsed_result.get('local_path')
+                
+                logger.info(f"✅ Portal cover generated")
+                logger.info(f"   Cloudinary URL: {cloudinary_url}")
+                logger.info(f"   Local path: {local_path}")
+                
+                # Add explicit fields for clarity
+                parsed_result['cloudinary_url'] = cloudinary_url
+                parsed_result['local_image_path'] = local_path
+                
+                # Only remember covers that made it to Cloudinary; a local copy is optional
+                if cloudinary_url and cloudinary_url.startswith('https://'):
+                    _record_cover(request_key, cloudinary_url, local_path)
+                
+                return parsed_result
             else:
-                logger.error("❌ No content in MCP result")
+                logger.error(f"❌ Portal cover generation failed: {parsed_result.get('message')}")
                 return None
                 
         except Exception as e:
             logger.error(f"❌ Portal cover generation error: {e}")
+            await self._discard_if_shared(e)
             return None
 
+def invalidate_glossary(domain: Optional[str] = None) -> None:
+    """Drop cached glossaries for a domain (or all domains) after its knowledge graph changes."""
+    if domain is None:
+        _glossary_cache.clear()
+        return
+    for key in [k for k in _glossary_cache.keys() if k[1] == domain]:
+        _glossary_cache.pop(key, None)
+
+async def close_shared_service() -> None:
+    """Close the shared MCP session opened by MCPClientService.get_shared()."""
+    global _shared_service
+    
+    service = _shared_service
+    if service is None or _shared_service_loop is not asyncio.get_running_loop():
+        return
+    
+    _shared_service = None
+    try:
+        await service.__aexit__(None, None, None)
+    except Exception as e:
+        logger.warning(f"⚠️ Error closing shared MCP session: {e}")
+
 # Convenience functions for easy integration
 async def generate_portal_cover_image(editorial_text: str, domain: str = "cancer_care", dimensions: str = "1792x1024") -> Optional[Dict[str, Any]]:
     """
@@ -189,8 +460,34 @@ async def generate_portal_cover_image(editorial_text: str, domain: str = "cancer
     Returns:
         Dictionary with image data or None if failed
     """
-    async with MCPClientService() as service:
-        return await service.generate_portal_cover_image(editorial_text, domain, dimensions=dimensions)
+    service = await MCPClientService.get_shared()
+    return await service.generate_portal_cover_image(editorial_text, domain, dimensions=dimensions)
+
+async def generate_portal_covers_batch(items: List[Dict[str, Any]], concurrency: int = 8) -> List[Optional[Dict[str, Any]]]:
+    """
+    Generate several portal cover images concurrently over the shared MCP session.
+    
+    Args:
+        items: One dict per cover with 'editorial_text' and optionally
+            'domain', 'style' and 'dimensions'
+        concurrency: Maximum number of covers generated at once (default: 8)
+        
+    Returns:
+        List of image data dictionaries (None for failures), in the order of items
+    """
+    service = await MCPClientService.get_shared()
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _one(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await service.generate_portal_cover_image(
+                item["editorial_text"],
+                item.get("domain", "cancer_care"),
+                style=item.get("style", "professional"),
+                dimensions=item.get("dimensions", "1792x1024")
+            )
+    
+    return await asyncio.gather(*(_one(item) for item in items))
 
 async def generate_glossary(domain: str = "cancer_care", max_terms: int = 20, min_centrality: float = 0.1) -> Optional[Dict[str, Any]]:
     """
@@ -204,5 +501,5 @@ async def generate_glossary(domain: str = "cancer_care", max_terms: int = 20, mi
     Returns:
         Dictionary with glossary data or None if failed
     """
-    async with MCPClientService() as service:
-        return await service.generate_glossary(domain, max_terms, min_centrality)
+    service = await MCPClientService.get_shared()
+    return await service.generate_glossary(domain, max_terms, min_centrality)
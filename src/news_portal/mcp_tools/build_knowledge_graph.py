@@ -7,6 +7,9 @@ One-time utility to build and save a knowledge graph for the 'cancer health care
 This is NOT an MCP tool - it's a standalone utility script.
 """
 
+import asyncio
+import hashlib
+import json
 import sys
 from pathlib import Path
 
@@ -14,61 +17,85 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
-from news_portal.mcp_tools.knowledge_graph_builder import KnowledgeGraphBuilderTool
+from news_portal.mcp_tools.knowledge_graph_builder import KnowledgeGraphBuilderTool, save_graph_arrays
 
 # Load environment variables
 load_dotenv()
 
-def build_and_save_knowledge_graph():
+# Domain documents for cancer health care
+DOMAIN_DOCUMENTS = (
+    """
+    Cancer is a group of diseases characterized by uncontrolled growth and spread of abnormal cells.
+    Cancer cells can invade surrounding tissues and metastasize to distant parts of the body.
+    Early detection and treatment significantly improve patient outcomes.
+    Treatment options include surgery, chemotherapy, radiation therapy, immunotherapy, targeted therapy, and hormone therapy.
+    """,
+    """
+    Cancer screening tests help detect cancer before symptoms appear.
+    Common screening tests include mammograms for breast cancer, colonoscopies for colorectal cancer,
+    and PSA tests for prostate cancer. Genetic testing can identify inherited cancer risk.
+    Lifestyle factors like smoking, diet, and exercise influence cancer risk.
+    """,
+    """
+    Oncology is the branch of medicine that deals with cancer diagnosis, treatment, and research.
+    Medical oncologists specialize in chemotherapy and immunotherapy treatments.
+    Surgical oncologists perform cancer-related surgeries.
+    Radiation oncologists administer radiation therapy.
+    """,
+    """
+    Palliative care focuses on improving quality of life for patients with serious illnesses.
+    Supportive care addresses symptoms and side effects of cancer and its treatment.
+    Hospice care provides end-of-life support for terminal cancer patients.
+    Mental health support is crucial for cancer patients and their families.
+    """,
+    """
+    Research in cancer includes clinical trials, biomarker discovery, and drug development.
+    Precision medicine tailors treatment based on individual genetic profiles.
+    Immunotherapy harnesses the immune system to fight cancer.
+    CAR-T cell therapy is an emerging treatment for certain blood cancers.
+    """
+)
+
+# Build parameters; part of the content hash so changing them forces a rebuild
+DOMAIN = "cancer health care"
+MAX_NODES = 50
+MIN_CENTRALITY = 0.01
+
+def documents_content_hash() -> str:
+    """Hash of the documents and build parameters the saved graph was built from."""
+    payload = "\0".join((DOMAIN, str(MAX_NODES), str(MIN_CENTRALITY), *DOMAIN_DOCUMENTS))
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+def build_and_save_knowledge_graph(batch_mode: bool = False):
     """Build and save the knowledge graph for cancer health care."""
     
-    print("Building knowledge graph for 'cancer health care' domain...")
+    output_dir = Path(__file__).parent / "knowledge_graphs"
+    output_path = output_dir / "cancer_health_care.json"
+    content_hash = documents_content_hash()
+    
+    # Skip the LLM build entirely if the saved graph came from the same inputs
+    if output_path.exists():
+        try:
+            with open(output_path, 'r') as f:
+                saved_hash = json.load(f).get("content_hash")
+        except (OSError, json.JSONDecodeError):
+            saved_hash = None
+        if saved_hash == content_hash:
+            print(f"✓ Knowledge graph is up to date: {output_path}")
+            return
     
-    # Domain documents for cancer health care
-    documents = [
-        """
-        Cancer is a group of diseases characterized by uncontrolled growth and spread of abnormal cells.
-        Cancer cells can invade surrounding tissues and metastasize to distant parts of the body.
-        Early detection and treatment significantly improve patient outcomes.
-        Treatment options include surgery, chemotherapy, radiation therapy, immunotherapy, targeted therapy, and hormone therapy.
-        """,
-        """
-        Cancer screening tests help detect cancer before symptoms appear.
-        Common screening tests include mammograms for breast cancer, colonoscopies for colorectal cancer,
-        and PSA tests for prostate cancer. Genetic testing can identify inherited cancer risk.
-        Lifestyle factors like smoking, diet, and exercise influence cancer risk.
-        """,
-        """
-        Oncology is the branch of medicine that deals with cancer diagnosis, treatment, and research.
-        Medical oncologists specialize in chemotherapy and immunotherapy treatments.
-        Surgical oncologists perform cancer-related surgeries.
-        Radiation oncologists administer radiation therapy.
-        """,
-        """
-        Palliative care focuses on improving quality of life for patients with serious illnesses.
-        Supportive care addresses symptoms and side effects of cancer and its treatment.
-        Hospice care provides end-of-life support for terminal cancer patients.
-        Mental health support is crucial for cancer patients and their families.
-        """,
-        """
-        Research in cancer includes clinical trials, biomarker discovery, and drug development.
-        Precision medicine tailors treatment based on individual genetic profiles.
-        Immunotherapy harnesses the immune system to fight cancer.
-        CAR-T cell therapy is an emerging treatment for certain blood cancers.
-        """
-    ]
+    print("Building knowledge graph for 'cancer health care' domain...")
     
     # Initialize the builder
-    from news_portal.mcp_tools.knowledge_graph_builder import KnowledgeGraphBuilderTool
     builder = KnowledgeGraphBuilderTool()
     
     # Build the knowledge graph
-    import asyncio
     result = asyncio.run(builder.execute(
-        domain="cancer health care",
-        documents=documents,
-        max_nodes=50,
-        min_centrality=0.01
+        domain=DOMAIN,
+        documents=list(DOMAIN_DOCUMENTS),
+        max_nodes=MAX_NODES,
+        min_centrality=MIN_CENTRALITY,
+        batch_mode=batch_mode
     ))
     
     if result.get("status") == "success":
@@ -80,14 +107,17 @@ def build_and_save_knowledge_graph():
             print(f"  - {node} (centrality: {score:.3f})")
         
         # Save the graph
-        output_dir = Path(__file__).parent / "knowledge_graphs"
         output_dir.mkdir(exist_ok=True)
-        output_path = output_dir / "cancer_health_care.json"
         
-        success = builder.save_graph("cancer health care", str(output_path))
+        success = builder.save_graph(DOMAIN, str(output_path), extra_fields={"content_hash": content_hash})
         
         if success:
             print(f"\n✓ Graph saved to: {output_path}")
+            
+            # Column-array copy that the server loads without JSON parsing
+            arrays_path = output_path.with_suffix(".npz")
+            save_graph_arrays(builder.get_knowledge_graph(DOMAIN), str(arrays_path))
+            print(f"✓ Graph arrays saved to: {arrays_path}")
             print(f"\nTo use this graph, restart the FastMCP server:")
             print(f"  fastmcp run src/news_portal/mcp_tools/fastmcp_server.py:mcp --transport http --port 8002")
         else:
@@ -104,7 +134,8 @@ if __name__ == "__main__":
             print("❌ OPENAI_API_KEY not found in environment variables!")
             sys.exit(1)
         
-        build_and_save_knowledge_graph()
+        # --batch: build through the OpenAI Batch API (half price, may take hours)
+        build_and_save_knowledge_graph(batch_mode="--batch" in sys.argv[1:])
     except Exception as e:
         print(f"\n✗ Failed to build knowledge graph: {e}")
         import traceback
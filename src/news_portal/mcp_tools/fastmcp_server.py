@@ -7,20 +7,28 @@ MCP server using FastMCP for various domain intelligence tools.
 """
 
 import asyncio
+import concurrent.futures
+import hashlib
 import sys
 import os
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+# Repository root (src/news_portal/mcp_tools/fastmcp_server.py -> 3 levels up)
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+ENV_FILE = PROJECT_ROOT / ".env"
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
-    project_root = Path(__file__).parent.parent.parent.parent
-    env_file = project_root / ".env"
-    if env_file.exists():
-        load_dotenv(env_file)
-        print(f"✅ Loaded environment variables from: {env_file}")
+    if ENV_FILE.exists():
+        load_dotenv(ENV_FILE)
+        print(f"✅ Loaded environment variables from: {ENV_FILE}")
     else:
-        print(f"⚠️  .env file not found at: {env_file}")
+        print(f"⚠️  .env file not found at: {ENV_FILE}")
 except ImportError:
     print("⚠️  python-dotenv not installed")
 
@@ -34,80 +42,198 @@ else:
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+import orjson
+from cachetools import TTLCache
 from fastmcp import FastMCP
 from news_portal.mcp_tools import (
     CoverImageGeneratorTool,
+    GlossaryBuilderTool,
+    KeywordExtractorTool,
     KnowledgeGraph,
     KnowledgeGraphNode,
     KnowledgeGraphEdge
 )
+from news_portal.mcp_tools.knowledge_graph_builder import load_graph_arrays, read_json_mmap
+
+# Warm-up runs once, when the server starts serving; importing this module
+# (fastmcp inspect, tests, tooling that only wants `mcp`) makes no network calls
+_warmup_done = False
+
+@asynccontextmanager
+async def _server_lifespan(server):
+    global _warmup_done
+    if not _warmup_done and os.getenv("MCP_WARMUP", "1") == "1":
+        _warmup_done = True
+        await asyncio.to_thread(warmup_tools)
+    yield {}
 
 # Create FastMCP server
-mcp = FastMCP("Domain Intelligence MCP Server")
+mcp = FastMCP("Domain Intelligence MCP Server", lifespan=_server_lifespan)
 
-# Initialize the cover image tool
+# Initialize the tools once; they share the knowledge graphs loaded below
 cover_image_tool = CoverImageGeneratorTool()
+kw_tool = KeywordExtractorTool()
+glossary_tool = GlossaryBuilderTool()
 
-# Shared knowledge graph storage
+# Shared knowledge graph storage, keyed by canonical domain name
 shared_knowledge_graphs = {}
 
+# Alternative domain names accepted by the tools
+_DOMAIN_ALIASES = {
+    "cancer_care": "cancer health care",
+    "cancer-care": "cancer health care",
+}
+
+def resolve_domain(domain: str) -> str:
+    """Map a domain alias to the canonical name its knowledge graph is stored under."""
+    return _DOMAIN_ALIASES.get(domain, domain)
+
+# Successful keyword/glossary results keyed by a hash of their inputs and the
+# knowledge graph version, which load_knowledge_graph() bumps on every reload
+RESULT_CACHE_MAXSIZE = 1024
+RESULT_CACHE_TTL_SECONDS = 600
+_result_cache = TTLCache(maxsize=RESULT_CACHE_MAXSIZE, ttl=RESULT_CACHE_TTL_SECONDS)
+_result_cache_lock = threading.Lock()
+_kg_version = 0
+
+def _result_cache_key(tool_name: str, *args) -> bytes:
+    """Hash tool inputs so large texts are never stored as cache keys."""
+    raw = "\x1f".join([tool_name, str(_kg_version), *map(str, args)])
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+def _cached_tool_call(key: bytes, use_cache: bool, make_coro):
+    """Serve a tool result from the cache, or run it and cache a success."""
+    if use_cache:
+        with _result_cache_lock:
+            cached = _result_cache.get(key)
+        if cached is not None:
+            return cached
+    
+    result = _run_tool(make_coro())
+    if use_cache and result.get("status") == "success":
+        with _result_cache_lock:
+            _result_cache[key] = result
+    return result
+
+def _with_cache_hint(result: dict, hint: str, **extra) -> dict:
+    """Attach a _meta.cache_hint so MCP clients know whether the result is reusable."""
+    return {"_meta": {"cache_hint": hint, **extra}, **result}
+
+# Fields of a cover result kept inline when the full result is persisted to disk.
+# The full result carries the base64 image and analysis, far too large to inline.
+COVER_INLINE_FIELDS = (
+    "status", "image_url", "original_url", "local_path",
+    "prompt_used", "dimensions", "style", "engine_used"
+)
+COVER_INLINE_REASONING_STEPS = 3
+COVER_INLINE_KEYWORDS = 5
+# The base64 image is never written to the result file: the image itself is on
+# Cloudinary (or in generated_images/ when COVER_SAVE_LOCAL=1 or the upload failed)
+COVER_PERSIST_EXCLUDED_FIELDS = frozenset({"image_data"})
+
+def _persist_cover_result(result: dict) -> dict:
+    """Write the cover result (minus the image bytes) to disk and return a compact summary."""
+    result_path = cover_image_tool.generated_images_dir / f"{uuid.uuid4().hex}.json"
+    persisted = {key: value for key, value in result.items() if key not in COVER_PERSIST_EXCLUDED_FIELDS}
+    result_path.write_bytes(orjson.dumps(persisted, default=str))
+    
+    compact = {field: result[field] for field in COVER_INLINE_FIELDS if field in result}
+    compact["keywords_extracted"] = result.get("keywords_extracted", [])[:COVER_INLINE_KEYWORDS]
+    compact["reasoning_steps"] = result.get("reasoning_steps", [])[:COVER_INLINE_REASONING_STEPS]
+    compact["result_path"] = str(result_path)
+    return compact
+
+# Long-lived event loop for the tools' async work. The MCP tool functions are
+# synchronous, so their coroutines are handed to this loop instead of building
+# a new thread pool and event loop on every call.
+TOOL_TIMEOUT_SECONDS = 300
+_tool_loop = asyncio.new_event_loop()
+threading.Thread(target=_tool_loop.run_forever, name="mcp-tool-loop", daemon=True).start()
+
+def _run_tool(coro):
+    """Run a tool coroutine on the background loop and wait for its result."""
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is _tool_loop:
+        # Blocking on the loop that has to run the coroutine would deadlock
+        coro.close()
+        raise RuntimeError("_run_tool() cannot be called from the tool loop itself")
+    
+    future = asyncio.run_coroutine_threadsafe(coro, _tool_loop)
+    try:
+        return future.result(timeout=TOOL_TIMEOUT_SECONDS)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+def _load_graph_json(graph_file: Path) -> KnowledgeGraph:
+    """Parse a knowledge graph JSON file written by the builder."""
+    graph_data = read_json_mmap(graph_file)
+    
+    # Restore nodes and edges (all keys are always written by the builder)
+    nodes = {
+        node_data["id"]: KnowledgeGraphNode(
+            id=node_data["id"],
+            label=node_data["label"],
+            node_type=sys.intern(node_data["node_type"]),
+            centrality_score=node_data["centrality_score"]
+        )
+        for node_data in graph_data["nodes"]
+    }
+    edges = [
+        KnowledgeGraphEdge(
+            source=edge_data["source"],
+            target=edge_data["target"],
+            relation=sys.intern(edge_data["relation"]),
+            weight=edge_data["weight"]
+        )
+        for edge_data in graph_data["edges"]
+    ]
+    
+    # Create knowledge graph
+    from datetime import datetime
+    return KnowledgeGraph(
+        nodes=nodes,
+        edges=edges,
+        domain=graph_data.get("domain", "unknown"),
+        created_at=graph_data.get("created_at", str(datetime.now()))
+    )
+
 # Load pre-built knowledge graph at startup
 def load_knowledge_graph():
     """Load the pre-built knowledge graph for 'cancer health care'."""
+    global _kg_version
     try:
         graph_file = Path(__file__).parent / "knowledge_graphs" / "cancer_health_care.json"
+        arrays_file = graph_file.with_suffix(".npz")
         
-        if graph_file.exists():
-            print(f"📊 Loading knowledge graph from: {graph_file}")
-            
-            # Load JSON file
-            import json
-            with open(graph_file, 'r') as f:
-                graph_data = json.load(f)
-            
-            # Restore nodes
-            nodes = {}
-            for node_data in graph_data.get("nodes", []):
-                node = KnowledgeGraphNode(
-                    id=node_data["id"],
-                    label=node_data["label"],
-                    node_type=node_data.get("node_type", "concept"),
-                    centrality_score=node_data.get("centrality_score", 0.0)
-                )
-                nodes[node.id] = node
-            
-            # Restore edges
-            edges = []
-            for edge_data in graph_data.get("edges", []):
-                edge = KnowledgeGraphEdge(
-                    source=edge_data["source"],
-                    target=edge_data["target"],
-                    relation=edge_data.get("relation", ""),
-                    weight=edge_data.get("weight", 1.0)
-                )
-                edges.append(edge)
-            
-            # Create knowledge graph
-            from datetime import datetime
-            kg = KnowledgeGraph(
-                nodes=nodes,
-                edges=edges,
-                domain=graph_data.get("domain", "unknown"),
-                created_at=graph_data.get("created_at", str(datetime.now()))
-            )
+        # Prefer the column-array copy unless the JSON has been rebuilt since
+        use_arrays = arrays_file.exists() and (
+            not graph_file.exists() or arrays_file.stat().st_mtime >= graph_file.stat().st_mtime
+        )
+        
+        if use_arrays or graph_file.exists():
+            if use_arrays:
+                print(f"📊 Loading knowledge graph from: {arrays_file}")
+                kg = load_graph_arrays(str(arrays_file))
+            else:
+                print(f"📊 Loading knowledge graph from: {graph_file}")
+                kg = _load_graph_json(graph_file)
             
             # Store in memory
             shared_knowledge_graphs["cancer health care"] = kg
-            shared_knowledge_graphs["cancer_care"] = kg  # Backward compatibility
             
-            # Set for the cover image tool
-            cover_image_tool.set_knowledge_graphs({
-                "cancer health care": kg,
-                "cancer_care": kg
-            })
+            # All tools see the same shared storage
+            for tool in (cover_image_tool, kw_tool, glossary_tool):
+                tool.set_knowledge_graphs(shared_knowledge_graphs)
+            
+            # Results computed against the previous graph are now stale
+            _kg_version += 1
             
             print(f"✅ Loaded knowledge graph: {len(kg.nodes)} nodes, {len(kg.edges)} edges")
-            print(f"✅ Available domains: {list(shared_knowledge_graphs.keys())}")
+            print(f"✅ Available domains: {list(shared_knowledge_graphs.keys())} (aliases: {list(_DOMAIN_ALIASES)})")
             return True
         else:
             print(f"⚠️  Knowledge graph not found at: {graph_file}")
@@ -122,13 +248,24 @@ def load_knowledge_graph():
 # Load the knowledge graph at startup
 load_knowledge_graph()
 
+def warmup_tools():
+    """Open the cover tool's clients before the first request (set MCP_WARMUP=0 to skip)."""
+    start = time.perf_counter()
+    try:
+        # On the tool loop, so the warmed connections are the ones execute() will use
+        _run_tool(cover_image_tool.warmup())
+        print(f"✅ Cover image tool warmed up in {time.perf_counter() - start:.2f}s")
+    except Exception as e:
+        print(f"⚠️  Cover image tool warm-up failed: {e}")
+
 @mcp.tool
 def generate_cover_image(
     editorial_text: str,
     domain: str = "cancer_care",
     style: str = "professional",
     dimensions: str = "1024x1024",
-    image_engine: str = "dall-e-3"
+    image_engine: str = "dall-e-3",
+    persist_result: bool = True
 ) -> dict:
     """
     Generate a contextual cover image for editorial content using knowledge graph insights.
@@ -139,56 +276,30 @@ def generate_cover_image(
         style: Image style (default: professional)
         dimensions: Image dimensions (default: 1024x1024)
         image_engine: Image generation engine (default: dall-e-3)
+        persist_result: Save the full result to a JSON file and return a compact
+            summary with its result_path (default: True)
     
     Returns:
         Dictionary with image URL, metadata, and reasoning steps
     """
     try:
+        domain = resolve_domain(domain)
         print(f"🔍 Debug: generate_cover_image called with domain: {domain}")
         print(f"🔍 Debug: Available knowledge graphs: {list(cover_image_tool.knowledge_graphs.keys())}")
         
-        # Run the async function in a new event loop
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an event loop, we need to use run_in_executor
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        lambda: asyncio.run(
-                            cover_image_tool.execute(
-                                editorial_text=editorial_text,
-                                domain=domain,
-                                style=style,
-                                dimensions=dimensions,
-                                image_engine=image_engine
-                            )
-                        )
-                    )
-                    result = future.result()
-            else:
-                result = loop.run_until_complete(
-                    cover_image_tool.execute(
-                        editorial_text=editorial_text,
-                        domain=domain,
-                        style=style,
-                        dimensions=dimensions,
-                        image_engine=image_engine
-                    )
-                )
-        except RuntimeError:
-            # No event loop running, create a new one
-            result = asyncio.run(
-                cover_image_tool.execute(
-                    editorial_text=editorial_text,
-                    domain=domain,
-                    style=style,
-                    dimensions=dimensions,
-                    image_engine=image_engine
-                )
+        result = _run_tool(
+            cover_image_tool.execute(
+                editorial_text=editorial_text,
+                domain=domain,
+                style=style,
+                dimensions=dimensions,
+                image_engine=image_engine
             )
-        return result
+        )
+        # Every call produces a new image URL; nothing to gain from caching it
+        if persist_result and result.get("status") == "success":
+            return _with_cache_hint(_persist_cover_result(result), "no-cache", persist_hint=True)
+        return _with_cache_hint(result, "no-cache")
     except Exception as e:
         return {
             "status": "error",
@@ -201,7 +312,8 @@ def extract_keywords(
     text: str,
     domain: str = "cancer_care",
     max_keywords: int = 10,
-    min_centrality: float = 0.05
+    min_centrality: float = 0.05,
+    use_cache: bool = True
 ) -> dict:
     """
     Extract high-centrality keywords from text using knowledge graph.
@@ -211,63 +323,20 @@ def extract_keywords(
         domain: The domain context
         max_keywords: Maximum number of keywords to return
         min_centrality: Minimum centrality threshold
+        use_cache: Reuse the result of an identical earlier call (default: True)
     
     Returns:
         Dictionary with extracted keywords and metadata
     """
     try:
-        from news_portal.mcp_tools import KeywordExtractorTool
-        
-        kw_tool = KeywordExtractorTool()
-        
-        # Get the knowledge graph from shared storage
-        if domain in shared_knowledge_graphs:
-            kw_tool.set_knowledge_graphs({domain: shared_knowledge_graphs[domain]})
-        else:
-            # Fallback to cover_image_tool for backward compatibility
-            try:
-                kgs = cover_image_tool.get_knowledge_graphs()
-                if domain in kgs:
-                    kw_tool.set_knowledge_graphs({domain: kgs[domain]})
-            except AttributeError:
-                pass
-        
-        # Run the async function with proper event loop handling
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        lambda: asyncio.run(
-                            kw_tool.execute(
-                                text=text,
-                                domain=domain,
-                                max_keywords=max_keywords,
-                                min_centrality=min_centrality
-                            )
-                        )
-                    )
-                    result = future.result()
-            else:
-                result = loop.run_until_complete(
-                    kw_tool.execute(
-                        text=text,
-                        domain=domain,
-                        max_keywords=max_keywords,
-                        min_centrality=min_centrality
-                    )
-                )
-        except RuntimeError:
-            result = asyncio.run(
-                kw_tool.execute(
-                    text=text,
-                    domain=domain,
-                    max_keywords=max_keywords,
-                    min_centrality=min_centrality
-                )
-            )
-        return result
+        domain = resolve_domain(domain)
+        key = _result_cache_key("extract_keywords", text, domain, max_keywords, min_centrality)
+        return _cached_tool_call(key, use_cache, lambda: kw_tool.execute(
+            text=text,
+            domain=domain,
+            max_keywords=max_keywords,
+            min_centrality=min_centrality
+        ))
     except Exception as e:
         return {
             "status": "error",
@@ -278,7 +347,8 @@ def extract_keywords(
 def build_glossary(
     domain: str = "cancer_care",
     max_terms: int = 20,
-    min_centrality: float = 0.1
+    min_centrality: float = 0.1,
+    use_cache: bool = True
 ) -> dict:
     """
     Build a high-value glossary from knowledge graph nodes.
@@ -287,60 +357,23 @@ def build_glossary(
         domain: The domain context
         max_terms: Maximum number of terms to include
         min_centrality: Minimum centrality threshold
+        use_cache: Reuse the result of an identical earlier call (default: True)
     
     Returns:
         Dictionary with glossary terms and definitions
     """
     try:
-        from news_portal.mcp_tools import GlossaryBuilderTool
-        
-        glossary_tool = GlossaryBuilderTool()
-        
-        # Get the knowledge graph from shared storage
-        if domain in shared_knowledge_graphs:
-            glossary_tool.set_knowledge_graphs({domain: shared_knowledge_graphs[domain]})
-        else:
-            # Fallback to cover_image_tool for backward compatibility
-            try:
-                kgs = cover_image_tool.get_knowledge_graphs()
-                if domain in kgs:
-                    glossary_tool.set_knowledge_graphs({domain: kgs[domain]})
-            except AttributeError:
-                pass
-        
-        # Run the async function with proper event loop handling
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        lambda: asyncio.run(
-                            glossary_tool.execute(
-                                domain=domain,
-                                max_terms=max_terms,
-                                min_centrality=min_centrality
-                            )
-                        )
-                    )
-                    result = future.result()
-            else:
-                result = loop.run_until_complete(
-                    glossary_tool.execute(
-                        domain=domain,
-                        max_terms=max_terms,
-                        min_centrality=min_centrality
-                    )
-                )
-        except RuntimeError:
-            result = asyncio.run(
-                glossary_tool.execute(
-                    domain=domain,
-                    max_terms=max_terms,
-                    min_centrality=min_centrality
-                )
-            )
-        return result
+        domain = resolve_domain(domain)
+        key = _result_cache_key("build_glossary", domain, max_terms, min_centrality)
+        result = _cached_tool_call(key, use_cache, lambda: glossary_tool.execute(
+            domain=domain,
+            max_terms=max_terms,
+            min_centrality=min_centrality
+        ))
+        # Deterministic for a given graph: reusable until the graph is reloaded
+        return _with_cache_hint(
+            result, "ephemeral", ttl_seconds=RESULT_CACHE_TTL_SECONDS, kg_version=_kg_version
+        )
     except Exception as e:
         return {
             "status": "error",
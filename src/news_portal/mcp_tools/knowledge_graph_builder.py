@@ -8,10 +8,16 @@ from documents using LLM + graph theory. This is NOT an MCP tool.
 """
 
 import logging
-from typing import Dict, Any, List
+import mmap
+import os
+import sys
+from typing import Dict, Any, List, Tuple
+from dataclasses import replace
 from datetime import datetime
 import networkx as nx
+import numpy as np
 import json
+import orjson
 from pathlib import Path
 
 from .mcp_tools_base import (
@@ -24,6 +30,172 @@ from .mcp_tools_base import (
 
 logger = logging.getLogger(__name__)
 
+def read_json_mmap(input_path: str) -> Any:
+    """Parse a JSON file straight from a read-only memory map, without reading it into a bytes copy."""
+    with open(input_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")  # mmap cannot map an empty file; raise the usual JSONDecodeError
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def save_graph_arrays(kg: KnowledgeGraph, output_path: str) -> None:
+    """
+    Save a knowledge graph as column arrays in an .npz file (no JSON parsing on load).
+    
+    Edges are dictionary-encoded: int32 indices into a vocabulary of endpoint ids
+    (graph nodes first, then any endpoints filtered out of the node set) and
+    int32 codes into a relation vocabulary.
+    """
+    nodes = list(kg.nodes.values())
+    vocab = {node.id: i for i, node in enumerate(nodes)}
+    relations = {}
+    edge_src = np.fromiter(
+        (vocab.setdefault(edge.source, len(vocab)) for edge in kg.edges), dtype=np.int32, count=len(kg.edges)
+    )
+    edge_dst = np.fromiter(
+        (vocab.setdefault(edge.target, len(vocab)) for edge in kg.edges), dtype=np.int32, count=len(kg.edges)
+    )
+    edge_relation = np.fromiter(
+        (relations.setdefault(edge.relation, len(relations)) for edge in kg.edges),
+        dtype=np.int32,
+        count=len(kg.edges)
+    )
+    np.savez(
+        output_path,
+        node_ids=np.array(list(vocab), dtype=str),
+        node_labels=np.array([node.label for node in nodes], dtype=str),
+        node_types=np.array([node.node_type for node in nodes], dtype=str),
+        centrality=np.array([node.centrality_score for node in nodes], dtype=np.float64),
+        edge_src=edge_src,
+        edge_dst=edge_dst,
+        edge_relation=edge_relation,
+        relation_vocab=np.array(list(relations), dtype=str),
+        edge_weights=np.array([edge.weight for edge in kg.edges], dtype=np.float32),
+        meta=np.array(json.dumps({
+            "domain": kg.domain,
+            "created_at": kg.created_at,
+            "version": kg.version
+        }))
+    )
+
+def _edge_columns(data) -> Tuple[List[str], List[str], List[str], List[float]]:
+    """Decode (sources, targets, relations, weights) from save_graph_arrays() output."""
+    if "edge_src" not in data:
+        # Files written before edges were dictionary-encoded
+        return (
+            data["edge_sources"].tolist(), data["edge_targets"].tolist(),
+            data["edge_relations"].tolist(), data["edge_weights"].tolist()
+        )
+    vocab = data["node_ids"]
+    return (
+        vocab[data["edge_src"]].tolist(), vocab[data["edge_dst"]].tolist(),
+        data["relation_vocab"][data["edge_relation"]].tolist(), data["edge_weights"].tolist()
+    )
+
+def load_graph_arrays(input_path: str) -> KnowledgeGraph:
+    """Load a knowledge graph written by save_graph_arrays()."""
+    with np.load(input_path, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        # node_ids may extend past the node columns with edge-only endpoints; zip stops at the nodes
+        nodes = {
+            node_id: KnowledgeGraphNode(
+                id=node_id, label=label, node_type=sys.intern(node_type), centrality_score=score
+            )
+            for node_id, label, node_type, score in zip(
+                data["node_ids"].tolist(), data["node_labels"].tolist(),
+                data["node_types"].tolist(), data["centrality"].tolist()
+            )
+        }
+        edges = [
+            KnowledgeGraphEdge(source=source, target=target, relation=sys.intern(relation), weight=weight)
+            for source, target, relation, weight in zip(*_edge_columns(data))
+        ]
+    
+    return KnowledgeGraph(
+        nodes=nodes,
+        edges=edges,
+        domain=meta["domain"],
+        created_at=meta["created_at"],
+        version=meta["version"]
+    )
+
+def load_graph_digraph(input_path: str) -> nx.DiGraph:
+    """Load the NetworkX graph straight from save_graph_arrays() output, skipping the dataclasses."""
+    with np.load(input_path, allow_pickle=False) as data:
+        sources, targets, relations, weights = _edge_columns(data)
+    G = nx.DiGraph()
+    G.add_edges_from(
+        (source, target, {"relation": relation, "weight": weight})
+        for source, target, relation, weight in zip(sources, targets, relations, weights)
+    )
+    return G
+
+def save_graph_jsonl(kg: KnowledgeGraph, output_path: str, extra_fields: Dict[str, Any] = None) -> None:
+    """Save a knowledge graph as JSON Lines: a header record, then one record per node and edge."""
+    header = {
+        "type": "header",
+        "domain": kg.domain,
+        "created_at": kg.created_at,
+        "version": kg.version,
+        "n_nodes": len(kg.nodes),
+        "n_edges": len(kg.edges),
+        **(extra_fields or {})
+    }
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(header) + b"\n")
+        for node in kg.nodes.values():
+            f.write(orjson.dumps({
+                "type": "node",
+                "id": node.id,
+                "label": node.label,
+                "node_type": node.node_type,
+                "centrality_score": node.centrality_score
+            }) + b"\n")
+        for edge in kg.edges:
+            f.write(orjson.dumps({
+                "type": "edge",
+                "source": edge.source,
+                "target": edge.target,
+                "relation": edge.relation,
+                "weight": edge.weight
+            }) + b"\n")
+
+def load_graph_jsonl(input_path: str) -> KnowledgeGraph:
+    """Load a knowledge graph written by save_graph_jsonl(), one line at a time."""
+    header = {}
+    nodes = {}
+    edges = []
+    with open(input_path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            record_type = record.get("type")
+            if record_type == "node":
+                nodes[record["id"]] = KnowledgeGraphNode(
+                    id=record["id"],
+                    label=record["label"],
+                    node_type=sys.intern(record.get("node_type", "concept")),
+                    centrality_score=record.get("centrality_score", 0.0)
+                )
+            elif record_type == "edge":
+                edges.append(KnowledgeGraphEdge(
+                    source=record["source"],
+                    target=record["target"],
+                    relation=sys.intern(record.get("relation", "")),
+                    weight=record.get("weight", 1.0)
+                ))
+            elif record_type == "header":
+                header = record
+    
+    return KnowledgeGraph(
+        nodes=nodes,
+        edges=edges,
+        domain=header.get("domain", "unknown"),
+        created_at=header.get("created_at", str(datetime.now())),
+        version=header.get("version", "1.0")
+    )
+
 class KnowledgeGraphBuilderTool(BaseMCPTool):
     """
     Utility class for building knowledge graphs from domain documents.
@@ -64,6 +236,11 @@ class KnowledgeGraphBuilderTool(BaseMCPTool):
                         "type": "number",
                         "default": Config.DEFAULT_MIN_CENTRALITY,
                         "description": "Minimum centrality threshold for node inclusion"
+                    },
+                    "batch_mode": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Use the OpenAI Batch API (cheaper, up to 24h turnaround)"
                     }
                 },
                 "required": ["domain", "documents"]
@@ -76,32 +253,30 @@ class KnowledgeGraphBuilderTool(BaseMCPTool):
         documents = kwargs["documents"]
         max_nodes = kwargs.get("max_nodes", Config.DEFAULT_MAX_NODES)
         min_centrality = kwargs.get("min_centrality", Config.DEFAULT_MIN_CENTRALITY)
+        batch_mode = kwargs.get("batch_mode", False)
         
         logger.info(f"Building knowledge graph for domain: {domain}")
         
         try:
-            # Step 1: Generate triplets using LLM
-            triplets = await self.llm_processor.generate_triplets_from_documents(
-                domain, documents, max_nodes
-            )
+            # Step 1: Generate triplets using LLM (Batch API for offline builds)
+            if batch_mode:
+                triplets = await self.llm_processor.generate_triplets_batch(
+                    domain, documents, max_nodes
+                )
+            else:
+                triplets = await self.llm_processor.generate_triplets_from_documents(
+                    domain, documents, max_nodes
+                )
             
-            # Step 2: Build NetworkX graph
-            G = self.graph_processor.build_graph_from_triplets(triplets)
+            # Step 2: Build the NetworkX graph and the node/edge records in one pass
+            G = nx.DiGraph()
             nodes = {}
             edges = []
             
             for source, relation, target in triplets:
-                # Add nodes
-                if source not in nodes:
-                    nodes[source] = KnowledgeGraphNode(
-                        id=source, label=source, node_type="concept"
-                    )
-                if target not in nodes:
-                    nodes[target] = KnowledgeGraphNode(
-                        id=target, label=target, node_type="concept"
-                    )
-                
-                # Add edge
+                G.add_edge(source, target, relation=relation, weight=1.0)
+                nodes.setdefault(source, KnowledgeGraphNode(id=source, label=source, node_type="concept"))
+                nodes.setdefault(target, KnowledgeGraphNode(id=target, label=target, node_type="concept"))
                 edges.append(KnowledgeGraphEdge(
                     source=source, target=target, relation=relation, weight=1.0
                 ))
@@ -109,15 +284,21 @@ class KnowledgeGraphBuilderTool(BaseMCPTool):
             # Step 3: Calculate centrality measures
             centrality_scores = await self.graph_processor.calculate_centrality_measures(G)
             
-            # Step 4: Update nodes with centrality scores
+            # Step 4: Update nodes with centrality scores (nodes are immutable)
             for node_id, score in centrality_scores.items():
                 if node_id in nodes:
-                    nodes[node_id].centrality_score = score
+                    nodes[node_id] = replace(nodes[node_id], centrality_score=score)
             
-            # Step 5: Filter by centrality threshold
+            # Step 5: Filter by centrality threshold (one boolean mask over the scores)
+            node_ids = list(nodes)
+            scores = np.fromiter(
+                (node.centrality_score for node in nodes.values()),
+                dtype=np.float64,
+                count=len(node_ids)
+            )
             filtered_nodes = {
-                k: v for k, v in nodes.items() 
-                if v.centrality_score >= min_centrality
+                node_ids[i]: nodes[node_ids[i]]
+                for i in np.flatnonzero(scores >= min_centrality)
             }
             
             # Step 6: Create knowledge graph
@@ -136,10 +317,7 @@ class KnowledgeGraphBuilderTool(BaseMCPTool):
                 "domain": domain,
                 "nodes_count": len(filtered_nodes),
                 "edges_count": len(edges),
-                "top_nodes": sorted(
-                    [(k, v.centrality_score) for k, v in filtered_nodes.items()],
-                    key=lambda x: x[1], reverse=True
-                )[:10],
+                "top_nodes": [(node.id, node.centrality_score) for node in kg.top_nodes(10)],
                 "message": f"Knowledge graph built with {len(filtered_nodes)} nodes and {len(edges)} edges"
             }
             
@@ -164,29 +342,40 @@ class KnowledgeGraphBuilderTool(BaseMCPTool):
         if not kg:
             return {"status": "error", "message": f"No knowledge graph found for domain: {domain}"}
         
-        centrality_scores = [node.centrality_score for node in kg.nodes.values()]
+        # Reuse the graph's cached centrality column; reductions run in NumPy
+        _, _, centrality_scores = kg.node_columns()
         
         return {
             "domain": domain,
             "nodes_count": len(kg.nodes),
             "edges_count": len(kg.edges),
             "centrality_stats": {
-                "min": min(centrality_scores) if centrality_scores else 0,
-                "max": max(centrality_scores) if centrality_scores else 0,
-                "mean": sum(centrality_scores) / len(centrality_scores) if centrality_scores else 0
+                "min": float(centrality_scores.min()) if centrality_scores.size else 0,
+                "max": float(centrality_scores.max()) if centrality_scores.size else 0,
+                "mean": float(centrality_scores.mean()) if centrality_scores.size else 0
             },
             "created_at": kg.created_at,
             "version": kg.version
         }
     
-    def save_graph(self, domain: str, output_path: str) -> bool:
-        """Save knowledge graph to JSON file."""
+    def save_graph(self, domain: str, output_path: str, extra_fields: Dict[str, Any] = None) -> bool:
+        """
+        Save knowledge graph to JSON file, with optional extra top-level fields.
+        
+        A .jsonl output path writes the line-per-record format instead.
+        """
         kg = self.knowledge_graphs.get(domain)
         if not kg:
             logger.error(f"No knowledge graph found for domain: {domain}")
             return False
         
         try:
+            if Path(output_path).suffix == ".jsonl":
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                save_graph_jsonl(kg, output_path, extra_fields)
+                logger.info(f"Knowledge graph saved to {output_path}")
+                return True
+            
             # Convert to dictionary
             graph_data = {
                 "domain": kg.domain,
@@ -212,14 +401,15 @@ class KnowledgeGraphBuilderTool(BaseMCPTool):
                     for edge in kg.edges
                 ]
             }
+            if extra_fields:
+                graph_data.update(extra_fields)
             
             # Ensure output directory exists
             output_path_obj = Path(output_path)
             output_path_obj.parent.mkdir(parents=True, exist_ok=True)
             
             # Write to JSON file
-            with open(output_path, 'w') as f:
-                json.dump(graph_data, f, indent=2)
+            output_path_obj.write_bytes(orjson.dumps(graph_data, option=orjson.OPT_INDENT_2))
             
             logger.info(f"Knowledge graph saved to {output_path}")
             return True
@@ -229,32 +419,37 @@ class KnowledgeGraphBuilderTool(BaseMCPTool):
             return False
     
     def load_graph(self, input_path: str) -> bool:
-        """Load knowledge graph from JSON file."""
+        """Load knowledge graph from JSON (or .jsonl) file."""
         try:
-            with open(input_path, 'r') as f:
-                graph_data = json.load(f)
+            if Path(input_path).suffix == ".jsonl":
+                kg = load_graph_jsonl(input_path)
+                self.knowledge_graphs[kg.domain] = kg
+                logger.info(f"Knowledge graph loaded from {input_path}")
+                return True
+            
+            graph_data = read_json_mmap(input_path)
             
             # Restore nodes
-            nodes = {}
-            for node_data in graph_data.get("nodes", []):
-                node = KnowledgeGraphNode(
+            nodes = {
+                node_data["id"]: KnowledgeGraphNode(
                     id=node_data["id"],
                     label=node_data["label"],
-                    node_type=node_data.get("node_type", "concept"),
+                    node_type=sys.intern(node_data.get("node_type", "concept")),
                     centrality_score=node_data.get("centrality_score", 0.0)
                 )
-                nodes[node.id] = node
+                for node_data in graph_data.get("nodes", [])
+            }
             
             # Restore edges
-            edges = []
-            for edge_data in graph_data.get("edges", []):
-                edge = KnowledgeGraphEdge(
+            edges = [
+                KnowledgeGraphEdge(
                     source=edge_data["source"],
                     target=edge_data["target"],
-                    relation=edge_data.get("relation", ""),
+                    relation=sys.intern(edge_data.get("relation", "")),
                     weight=edge_data.get("weight", 1.0)
                 )
-                edges.append(edge)
+                for edge_data in graph_data.get("edges", [])
+            ]
             
             # Create knowledge graph
             kg = KnowledgeGraph(
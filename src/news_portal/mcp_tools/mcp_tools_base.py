@@ -6,19 +6,35 @@ Base MCP Tool Classes and Shared Utilities
 Common base classes and utilities for all Domain Intelligence MCP tools.
 """
 
+import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
+import re
+import sqlite3
+import sys
+import weakref
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import closing
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import networkx as nx
 import numpy as np
+import pybase64
+import openai
 from openai import AsyncOpenAI
-import requests
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+import httpx
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KnowledgeGraphNode:
     """Represents a node in the knowledge graph."""
     id: str
@@ -27,7 +43,7 @@ class KnowledgeGraphNode:
     node_type: str = "concept"
     metadata: Dict[str, Any] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KnowledgeGraphEdge:
     """Represents an edge in the knowledge graph."""
     source: str
@@ -44,6 +60,111 @@ class KnowledgeGraph:
     domain: str
     created_at: str
     version: str = "1.0"
+    _node_columns: Optional[Tuple[List[str], List[str], np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _edge_index: Optional[Dict[str, List[KnowledgeGraphEdge]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _edge_index_size: int = field(default=0, init=False, repr=False, compare=False)
+    _label_index: Optional[Tuple[str, List[int], Dict[str, int], int, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def node_columns(self) -> Tuple[List[str], List[str], np.ndarray]:
+        """
+        Column view of the nodes: (ids, lowercased labels, centrality scores).
+        
+        Built on first use and reused; graphs are not modified once constructed.
+        """
+        if self._node_columns is None or len(self._node_columns[0]) != len(self.nodes):
+            ids = list(self.nodes)
+            labels = [node.label.lower() for node in self.nodes.values()]
+            centrality = np.fromiter(
+                (node.centrality_score for node in self.nodes.values()),
+                dtype=np.float64,
+                count=len(ids)
+            )
+            self._node_columns = (ids, labels, centrality)
+        return self._node_columns
+    
+    def top_nodes(self, k: int, min_centrality: float = 0.0) -> List[KnowledgeGraphNode]:
+        """Return up to k nodes with the highest centrality, at or above min_centrality."""
+        ids, _, centrality = self.node_columns()
+        if k <= 0 or not ids:
+            return []
+        
+        if k < len(ids):
+            idx = np.argpartition(-centrality, k - 1)[:k]
+        else:
+            idx = np.arange(len(ids))
+        idx = idx[np.argsort(-centrality[idx], kind="stable")]
+        return [self.nodes[ids[i]] for i in idx if centrality[i] >= min_centrality]
+    
+    def edges_for(self, node_id: str) -> List[KnowledgeGraphEdge]:
+        """
+        Edges with node_id as source or target, in edge-list order.
+        
+        The adjacency index is built on first use and rebuilt if edges are added.
+        """
+        if self._edge_index is None or self._edge_index_size != len(self.edges):
+            index = defaultdict(list)
+            for edge in self.edges:
+                index[edge.source].append(edge)
+                if edge.target != edge.source:
+                    index[edge.target].append(edge)
+            self._edge_index = index
+            self._edge_index_size = len(self.edges)
+        return self._edge_index.get(node_id, [])
+    
+    def match_node(self, keyword: str) -> Optional[KnowledgeGraphNode]:
+        """Node whose lowercased label contains the keyword or is contained in it."""
+        match = self.match_node_index(keyword)
+        return self.nodes[self.node_columns()[0][match]] if match is not None else None
+    
+    def match_node_index(self, keyword: str) -> Optional[int]:
+        """
+        Position in node_columns() of the node matched by match_node().
+        
+        Same result as scanning the labels in node order for the first one that
+        contains the keyword or is contained in it, without the per-label loop:
+        labels containing the keyword are found with one str.find() over all
+        labels joined together, and labels contained in the keyword by looking
+        up the keyword's substrings in a label -> first position dict. Indexes
+        are built on first use.
+        """
+        _, labels, _ = self.node_columns()
+        if self._label_index is None or self._label_index[4] is not labels:
+            first = {}
+            for i, label in enumerate(labels):
+                first.setdefault(label, i)
+            starts = list(accumulate((len(label) + 1 for label in labels[:-1]), initial=0))
+            longest = max(map(len, labels), default=0)
+            self._label_index = ("\0".join(labels), starts, first, longest, labels)
+        joined, starts, first, longest, _ = self._label_index
+        if not labels:
+            return None
+        
+        keyword_lower = keyword.lower()
+        if "\0" in keyword_lower:
+            # Would match across label boundaries in the joined string; scan instead
+            return next(
+                (i for i, label in enumerate(labels) if keyword_lower in label or label in keyword_lower),
+                None
+            )
+        
+        # First label containing the keyword
+        offset = joined.find(keyword_lower)
+        match = bisect_right(starts, offset) - 1 if offset >= 0 else None
+        
+        # First label contained in the keyword: only substrings up to the longest label can be one
+        n = len(keyword_lower)
+        for length in range(min(n, longest) + 1):
+            for begin in range(n - length + 1):
+                i = first.get(keyword_lower[begin:begin + length])
+                if i is not None and (match is None or i < match):
+                    match = i
+        return match
 
 class BaseMCPTool(ABC):
     """Base class for all MCP tools."""
@@ -66,6 +187,18 @@ class BaseMCPTool(ABC):
         """Set the knowledge graphs for this tool."""
         self.knowledge_graphs = knowledge_graphs
 
+# GPU centrality via the nx-cugraph NetworkX backend, used only when installed
+_CUGRAPH_BACKEND_AVAILABLE = importlib.util.find_spec("nx_cugraph") is not None
+
+def _run_centrality(algorithm, G: nx.DiGraph, **kwargs) -> Dict[str, float]:
+    """Run a NetworkX centrality algorithm on the cuGraph backend if available, else on CPU."""
+    if _CUGRAPH_BACKEND_AVAILABLE:
+        try:
+            return algorithm(G, backend="cugraph", **kwargs)
+        except (nx.NetworkXNotImplemented, NotImplementedError, ImportError) as e:
+            logger.debug(f"cuGraph backend unavailable for {algorithm.__name__}, using CPU: {e}")
+    return algorithm(G, **kwargs)
+
 class GraphProcessor:
     """Utility class for graph processing operations."""
     
@@ -73,28 +206,38 @@ class GraphProcessor:
     async def calculate_centrality_measures(G: nx.DiGraph) -> Dict[str, float]:
         """Calculate centrality measures for graph nodes."""
         
-        # Calculate multiple centrality measures with error handling
-        try:
-            eigenvector_centrality = nx.eigenvector_centrality(G, max_iter=1000)
-        except nx.PowerIterationFailedConvergence:
-            # Fallback to degree centrality if eigenvector fails
-            eigenvector_centrality = nx.degree_centrality(G)
-        
-        betweenness_centrality = nx.betweenness_centrality(G)
-        closeness_centrality = nx.closeness_centrality(G)
-        pagerank = nx.pagerank(G)
-        
-        # Combine measures (weighted average)
-        combined_scores = {}
-        for node in G.nodes():
-            combined_scores[node] = (
-                0.4 * eigenvector_centrality.get(node, 0) +
-                0.3 * betweenness_centrality.get(node, 0) +
-                0.2 * closeness_centrality.get(node, 0) +
-                0.1 * pagerank.get(node, 0)
+        # Only compute measures with a non-zero weight; setting a weight to 0 in
+        # Config.CENTRALITY_WEIGHTS (e.g. betweenness on huge graphs) skips it entirely
+        weights = {name: w for name, w in Config.CENTRALITY_WEIGHTS.items() if w}
+        measures = {}
+        
+        if "eigenvector" in weights:
+            try:
+                # Power iteration: the ARPACK variant raises AmbiguousSolution on
+                # disconnected graphs, which would silently degrade to degree centrality
+                measures["eigenvector"] = _run_centrality(nx.eigenvector_centrality, G, max_iter=1000)
+            except nx.NetworkXException:
+                # Fallback to degree centrality if eigenvector fails
+                measures["eigenvector"] = nx.degree_centrality(G)
+        
+        if "betweenness" in weights:
+            # Sample pivots for large graphs; exact below Config.BC_SAMPLES nodes
+            bc_samples = Config.BC_SAMPLES if len(G) > Config.BC_SAMPLES else None
+            measures["betweenness"] = _run_centrality(nx.betweenness_centrality, G, k=bc_samples, seed=42)
+        if "closeness" in weights:
+            measures["closeness"] = _run_centrality(nx.closeness_centrality, G)
+        if "pagerank" in weights:
+            measures["pagerank"] = _run_centrality(nx.pagerank, G)
+        
+        # Combine measures (weighted average over node-aligned arrays)
+        nodes = list(G.nodes())
+        combined = np.zeros(len(nodes), dtype=np.float64)
+        for name, scores in measures.items():
+            combined += weights[name] * np.fromiter(
+                (scores.get(node, 0.0) for node in nodes), dtype=np.float64, count=len(nodes)
             )
         
-        return combined_scores
+        return dict(zip(nodes, combined.tolist()))
     
     @staticmethod
     def build_graph_from_triplets(triplets: List[tuple]) -> nx.DiGraph:
@@ -104,21 +247,114 @@ class GraphProcessor:
             G.add_edge(source, target, relation=relation, weight=1.0)
         return G
 
+class LLMResponseCache:
+    """Persistent cache of LLM completions keyed by a hash of model, prompt and request options."""
+    
+    def __init__(self, path: Path = None):
+        self.path = Path(path or Config.LLM_CACHE_PATH).expanduser()
+    
+    @staticmethod
+    def key(model: str, prompt: str, **options: Any) -> str:
+        # The model and every option that shapes the output are part of the key, so
+        # switching models or e.g. max_tokens/json_mode never serves stale output
+        raw = f"{model}|{prompt}" + "".join(f"|{name}={options[name]!r}" for name in sorted(options))
+        return hashlib.blake2b(raw.encode("utf-8")).hexdigest()
+    
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE IF NOT EXISTS completions (key TEXT PRIMARY KEY, content TEXT)")
+        return conn
+    
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT content FROM completions WHERE key = ?", (key,)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+    
+    def set(self, key: str, content: str) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("INSERT OR REPLACE INTO completions (key, content) VALUES (?, ?)", (key, content))
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+# Chat completions share one concurrency cap per event loop and retry with
+# jittered backoff on rate limits and transient API failures. Keyed weakly on the
+# loop, so a finished asyncio.run() loop does not keep its semaphore alive.
+_RETRYABLE_LLM_ERRORS = (
+    openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError
+)
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(Config.MAX_CONCURRENT_LLM)
+    return semaphore
+
+async def chat_completion(client: AsyncOpenAI, **kwargs):
+    """Create a chat completion under the shared concurrency cap, retrying transient errors."""
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(Config.LLM_MAX_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        retry=retry_if_exception_type(_RETRYABLE_LLM_ERRORS),
+        reraise=True
+    ):
+        with attempt:
+            async with _get_llm_semaphore():
+                return await client.chat.completions.create(**kwargs)
+
+# One "<entity1, relation, entity2>" triplet, numbered ("1. <...>") or not
+_TRIPLET_RE = re.compile(r"<\s*([^,<>\n]+?)\s*,\s*([^,<>\n]+?)\s*,\s*([^,<>\n]+?)\s*>")
+
 class LLMProcessor:
     """Utility class for LLM operations."""
     
-    def __init__(self, openai_client: AsyncOpenAI):
+    def __init__(self, openai_client: AsyncOpenAI, use_cache: bool = True):
         self.client = openai_client
+        self.cache = LLMResponseCache() if use_cache else None
     
-    async def generate_triplets_from_documents(
-        self, 
-        domain: str, 
-        documents: List[str], 
-        max_nodes: int
-    ) -> List[tuple]:
-        """Generate knowledge graph triplets from documents using LLM."""
+    async def _complete(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float = 0.1,
+        json_mode: bool = False
+    ) -> str:
+        """Run a single-message chat completion, served from the response cache when possible."""
+        key = LLMResponseCache.key(
+            model, prompt, max_tokens=max_tokens, temperature=temperature, json_mode=json_mode
+        ) if self.cache else None
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+        response = await chat_completion(
+            self.client,
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **extra
+        )
+        content = response.choices[0].message.content
         
-        prompt = f"""
+        if key and content:
+            self.cache.set(key, content)
+        return content
+    
+    @staticmethod
+    def build_triplet_prompt(domain: str, documents: List[str], max_triplets: int) -> str:
+        """Build the triplet extraction prompt for one shard of documents."""
+        return f"""
         You are a domain expert in {domain}. Analyze the following documents and extract knowledge graph triplets.
         
         Format: <entity1, relation, entity2>
@@ -128,7 +364,7 @@ class LLMProcessor:
         - <chemotherapy, treats, cancer>
         - <tumor, located_in, lung>
         
-        Extract {max_nodes} high-quality triplets that represent the core knowledge in this domain.
+        Extract {max_triplets} high-quality triplets that represent the core knowledge in this domain.
         Focus on:
         1. Hierarchical relationships (is_a, part_of, contains)
         2. Causal relationships (causes, treats, prevents)
@@ -137,37 +373,130 @@ class LLMProcessor:
         5. Functional relationships (enables, inhibits)
         
         Documents:
-        {chr(10).join(documents[:5])}  # Limit to first 5 docs for prompt size
+        {chr(10).join(documents)}
         
         Return only the triplets, one per line, in the format: <entity1, relation, entity2>
         """
+    
+    @staticmethod
+    def parse_triplets(response_text: str) -> List[tuple]:
+        """Parse <entity1, relation, entity2> lines from an LLM response."""
+        # Relations repeat across many edges; share one string object per relation
+        triplets = [
+            (m.group(1), sys.intern(m.group(2)), m.group(3))
+            for m in _TRIPLET_RE.finditer(response_text)
+        ]
         
-        response = await self.client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_tokens=Config.MAX_PROMPT_TOKENS
-        )
+        return triplets
+    
+    @staticmethod
+    def shard_documents(documents: List[str]) -> List[List[str]]:
+        """Split documents into prompt-sized shards."""
+        # Verbatim repeats (and blank documents) would only spend prompt tokens again
+        documents = list(dict.fromkeys(doc for doc in documents if doc.strip()))
+        size = Config.TRIPLET_DOCS_PER_SHARD
+        return [documents[i:i + size] for i in range(0, len(documents), size)]
+    
+    async def generate_triplets_from_documents(
+        self, 
+        domain: str, 
+        documents: List[str], 
+        max_nodes: int
+    ) -> List[tuple]:
+        """Generate knowledge graph triplets from documents using LLM."""
         
-        # Parse triplets from response
-        triplets = []
-        for line in response.choices[0].message.content.split('\n'):
-            line = line.strip()
-            # Handle numbered format: "1. <entity, relation, object>"
-            if line and '.' in line and '<' in line and '>' in line:
-                # Extract the triplet part after the number
-                triplet_part = line.split('.', 1)[1].strip()
-                line = triplet_part
-            
-            if line.startswith('<') and line.endswith('>'):
-                try:
-                    content = line[1:-1]
-                    parts = [p.strip() for p in content.split(',')]
-                    if len(parts) == 3:
-                        triplets.append((parts[0], parts[1], parts[2]))
-                except:
-                    continue
+        # One request per shard, run concurrently, so no document is dropped
+        shards = self.shard_documents(documents)
+        if not shards:
+            return []
+        triplets_per_shard = -(-max_nodes // len(shards))
+        semaphore = asyncio.Semaphore(Config.TRIPLET_CONCURRENCY)
+        
+        async def extract_shard(shard: List[str]) -> List[tuple]:
+            async with semaphore:
+                content = await self._complete(
+                    "gpt-4o",
+                    self.build_triplet_prompt(domain, shard, triplets_per_shard),
+                    max_tokens=Config.MAX_PROMPT_TOKENS
+                )
+            return self.parse_triplets(content)
+        
+        shard_triplets = await asyncio.gather(*(extract_shard(shard) for shard in shards))
+        return self.merge_triplets(shard_triplets, max_nodes)
+    
+    async def generate_triplets_batch(
+        self,
+        domain: str,
+        documents: List[str],
+        max_nodes: int,
+        poll_interval: float = None
+    ) -> List[tuple]:
+        """
+        Generate triplets through the OpenAI Batch API (half price, up to 24h turnaround).
         
+        Meant for offline knowledge graph builds; one batch request per document shard.
+        """
+        poll_interval = poll_interval or Config.BATCH_POLL_INTERVAL_SECONDS
+        shards = self.shard_documents(documents)
+        if not shards:
+            return []
+        triplets_per_shard = -(-max_nodes // len(shards))
+        
+        requests_jsonl = "\n".join(
+            json.dumps({
+                "custom_id": f"shard-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o",
+                    "messages": [{"role": "user", "content": self.build_triplet_prompt(domain, shard, triplets_per_shard)}],
+                    "temperature": 0.1,
+                    "max_tokens": Config.MAX_PROMPT_TOKENS
+                }
+            })
+            for i, shard in enumerate(shards)
+        )
+        
+        batch_file = await self.client.files.create(
+            file=("triplets.jsonl", requests_jsonl.encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted triplet batch {batch.id} with {len(shards)} requests")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+            logger.info(f"Triplet batch {batch.id}: {batch.status}")
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Triplet batch {batch.id} ended with status: {batch.status}")
+        
+        output = await self.client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response")
+            if not response or response.get("status_code") != 200:
+                logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            results[record["custom_id"]] = self.parse_triplets(content)
+        
+        # Batch output order is not guaranteed; restore shard order
+        shard_triplets = [results.get(f"shard-{i}", []) for i in range(len(shards))]
+        return self.merge_triplets(shard_triplets, max_nodes)
+    
+    @staticmethod
+    def merge_triplets(shard_triplets: List[List[tuple]], max_nodes: int) -> List[tuple]:
+        """Merge per-shard triplets in shard order, dropping duplicates found by several shards."""
+        triplets = list(dict.fromkeys(t for batch in shard_triplets for t in batch))
         return triplets[:max_nodes]
     
     async def extract_candidate_keywords(self, text: str) -> List[str]:
@@ -186,15 +515,10 @@ class LLMProcessor:
         Return only the keywords, one per line, without explanations.
         """
         
-        response = await self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_tokens=500
-        )
+        content = await self._complete("gpt-4o-mini", prompt, max_tokens=500)
         
         keywords = [
-            line.strip() for line in response.choices[0].message.content.split('\n')
+            line.strip() for line in content.split('\n')
             if line.strip() and len(line.strip()) > 2
         ]
         
@@ -209,10 +533,7 @@ class LLMProcessor:
         """Generate definition for a term using knowledge graph context."""
         
         # Find related nodes
-        related_nodes = []
-        for edge in kg.edges:
-            if edge.source == term or edge.target == term:
-                related_nodes.append(edge)
+        related_nodes = kg.edges_for(term)
         
         prompt = f"""
         Generate a concise, accurate definition for the term "{term}" in the context of {domain}.
@@ -224,33 +545,127 @@ class LLMProcessor:
         Keep it under 100 words.
         """
         
-        response = await self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_tokens=150
-        )
+        content = await self._complete("gpt-4o-mini", prompt, max_tokens=150)
         
-        return response.choices[0].message.content.strip()
+        return content.strip()
+    
+    async def generate_definitions_batch(
+        self, 
+        terms: List[str], 
+        domain: str, 
+        kg: KnowledgeGraph
+    ) -> Dict[str, str]:
+        """
+        Generate definitions for many terms, several terms per LLM request.
+        
+        Terms the model leaves out of a batch response fall back to generate_definition().
+        """
+        size = Config.DEFINITION_BATCH_SIZE
+        batches = [terms[i:i + size] for i in range(0, len(terms), size)]
+        semaphore = asyncio.Semaphore(Config.TRIPLET_CONCURRENCY)
+        
+        async def define_batch(batch: List[str]) -> Dict[str, str]:
+            term_blocks = "\n".join(
+                f'"{term}":\n' + "\n".join(
+                    f"  - {e.source} {e.relation} {e.target}" for e in kg.edges_for(term)[:5]
+                )
+                for term in batch
+            )
+            prompt = f"""
+        Generate a concise, accurate definition for each of the following terms in the context of {domain}.
+        
+        Terms and related concepts from knowledge graph:
+        {term_blocks}
+        
+        Provide clear, professional definitions suitable for a glossary, each under 100 words.
+        Return a JSON object mapping each term exactly as written to its definition.
+        """
+            async with semaphore:
+                content = await self._complete(
+                    "gpt-4o-mini", prompt, max_tokens=150 * len(batch), json_mode=True
+                )
+            try:
+                parsed = json.loads(content)
+            except (TypeError, json.JSONDecodeError) as e:
+                logger.warning(f"Definition batch response was not valid JSON: {e}")
+                parsed = {}
+            return {
+                term: parsed[term].strip()
+                for term in batch
+                if isinstance(parsed.get(term), str) and parsed[term].strip()
+            }
+        
+        definitions = {}
+        for batch_definitions in await asyncio.gather(*(define_batch(b) for b in batches)):
+            definitions.update(batch_definitions)
+        
+        missing = [term for term in terms if term not in definitions]
+        if missing:
+            fallback = await asyncio.gather(
+                *(self.generate_definition(term, domain, kg) for term in missing)
+            )
+            definitions.update(zip(missing, fallback))
+        return definitions
+
+# Pooled async HTTP client for image downloads and uploads, one per event loop
+# (connections are bound to the loop that opened them). Call
+# close_image_http_client() before a loop ends to release its connections.
+_image_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+def get_image_http_client() -> httpx.AsyncClient:
+    """Return the keep-alive httpx client for image traffic on the running loop."""
+    loop = asyncio.get_running_loop()
+    client = _image_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _image_http_clients[loop] = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, write=120.0),
+            limits=httpx.Limits(max_keepalive_connections=10),
+            follow_redirects=True
+        )
+    return client
+
+async def close_image_http_client() -> None:
+    """Close the running loop's image client, if it opened one."""
+    client = _image_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+# Sensitive medical terms that switch cover images to the supportive guardrails.
+# One compiled alternation scans the text once (substring match, as before).
+SENSITIVE_KEYWORDS = (
+    'death', 'dying', 'terminal', 'fatal', 'mortality',
+    'pain', 'suffering', 'distress', 'trauma',
+    'crisis', 'emergency', 'urgent'
+)
+_SENSITIVE_CONTENT_RE = re.compile("|".join(map(re.escape, SENSITIVE_KEYWORDS)), re.IGNORECASE)
 
 class ImageProcessor:
     """Utility class for image processing operations."""
     
     @staticmethod
-    async def download_and_encode_image(image_url: str) -> str:
-        """Download image and encode as base64."""
+    async def download_image_bytes(image_url: str) -> bytes:
+        """Download image and return the raw bytes (empty on failure)."""
         try:
-            response = requests.get(image_url, timeout=30)
+            response = await get_image_http_client().get(image_url)
             response.raise_for_status()
-            
-            # Convert to base64
-            import base64
-            image_base64 = base64.b64encode(response.content).decode('utf-8')
-            return image_base64
+            return response.content
             
         except Exception as e:
             logger.error(f"Image download failed: {e}")
-            return ""
+            return b""
+    
+    @staticmethod
+    async def download_and_encode_image(image_url: str) -> str:
+        """Download image and encode as base64."""
+        image_bytes = await ImageProcessor.download_image_bytes(image_url)
+        return pybase64.b64encode(image_bytes).decode('utf-8')
+    
+    @staticmethod
+    async def download_and_encode_images(image_urls: List[str]) -> List[str]:
+        """Download and base64-encode several images concurrently."""
+        return await asyncio.gather(
+            *(ImageProcessor.download_and_encode_image(url) for url in image_urls)
+        )
     
     @staticmethod
     def apply_content_guardrails(
@@ -260,16 +675,7 @@ class ImageProcessor:
     ) -> str:
         """Apply content guardrails for sensitive medical topics."""
         
-        sensitive_keywords = [
-            'death', 'dying', 'terminal', 'fatal', 'mortality',
-            'pain', 'suffering', 'distress', 'trauma',
-            'crisis', 'emergency', 'urgent'
-        ]
-        
-        has_sensitive_content = any(
-            keyword in editorial_text.lower() 
-            for keyword in sensitive_keywords
-        )
+        has_sensitive_content = _SENSITIVE_CONTENT_RE.search(editorial_text) is not None
         
         if has_sensitive_content:
             return """
@@ -294,35 +700,41 @@ class ImageProcessor:
         context_analysis: Dict[str, Any]
     ) -> List[str]:
         """Generate domain-specific visual elements."""
-        
-        domain_visuals = {
-            "oncology": [
-                "molecular structures", "DNA helix", "cell division", 
-                "medical research", "laboratory equipment", "treatment symbols"
-            ],
-            "medicine": [
-                "medical symbols", "stethoscope", "cross", 
-                "healthcare professionals", "medical equipment"
-            ],
-            "research": [
-                "microscopes", "laboratory", "data visualization", 
-                "scientific charts", "research equipment"
-            ],
-            "technology": [
-                "circuit patterns", "digital elements", "network connections",
-                "innovation symbols", "tech interfaces"
-            ]
-        }
-        
-        base_elements = domain_visuals.get(domain, ["professional symbols", "domain-specific imagery"])
-        
-        # Add context-specific elements
-        if context_analysis.get('mood') == 'hopeful':
-            base_elements.extend(["light rays", "growth symbols", "positive imagery"])
-        elif context_analysis.get('mood') == 'innovative':
-            base_elements.extend(["innovation symbols", "breakthrough imagery", "future concepts"])
-        
-        return base_elements[:4]  # Limit to 4 elements
+        # Only the domain and mood matter, so the result is memoized on those;
+        # a non-string mood (e.g. a list from the LLM) is unhashable and never matches anyway
+        mood = context_analysis.get('mood')
+        return list(_visual_elements_for(domain, mood if isinstance(mood, str) else None))
+
+_DOMAIN_VISUALS = {
+    "oncology": (
+        "molecular structures", "DNA helix", "cell division", 
+        "medical research", "laboratory equipment", "treatment symbols"
+    ),
+    "medicine": (
+        "medical symbols", "stethoscope", "cross", 
+        "healthcare professionals", "medical equipment"
+    ),
+    "research": (
+        "microscopes", "laboratory", "data visualization", 
+        "scientific charts", "research equipment"
+    ),
+    "technology": (
+        "circuit patterns", "digital elements", "network connections",
+        "innovation symbols", "tech interfaces"
+    )
+}
+
+@lru_cache(maxsize=1024)
+def _visual_elements_for(domain: str, mood: Optional[str]) -> Tuple[str, ...]:
+    base_elements = _DOMAIN_VISUALS.get(domain, ("professional symbols", "domain-specific imagery"))
+    
+    # Add context-specific elements
+    if mood == 'hopeful':
+        base_elements += ("light rays", "growth symbols", "positive imagery")
+    elif mood == 'innovative':
+        base_elements += ("innovation symbols", "breakthrough imagery", "future concepts")
+    
+    return base_elements[:4]  # Limit to 4 elements
 
 class Config:
     """Configuration constants for all tools."""
@@ -343,6 +755,9 @@ class Config:
         "pagerank": 0.1
     }
     
+    # Pivot nodes sampled for approximate betweenness centrality
+    BC_SAMPLES = 500
+    
     # Image generation settings
     DEFAULT_IMAGE_SIZE = "1024x1024"
     DEFAULT_IMAGE_QUALITY = "standard"
@@ -351,7 +766,27 @@ class Config:
     # Style options
     SUPPORTED_STYLES = ["professional", "academic", "modern", "minimalist"]
     
+    # Triplet extraction: documents per LLM request and concurrent requests
+    TRIPLET_DOCS_PER_SHARD = 5
+    TRIPLET_CONCURRENCY = 8
+    BATCH_POLL_INTERVAL_SECONDS = 30
+    
+    # Concurrent chat completions per process and attempts per completion
+    MAX_CONCURRENT_LLM = 32
+    LLM_MAX_ATTEMPTS = 5
+    
+    # Glossary terms defined per LLM request
+    DEFINITION_BATCH_SIZE = 10
+    
     # Text processing limits
     MAX_TEXT_LENGTH_FOR_ANALYSIS = 2000
     MAX_CONTENT_LENGTH_FOR_SUMMARY = 4000
     MAX_PROMPT_TOKENS = 4000
+    
+    # Persistent cache of LLM completions (triplets, keywords, definitions)
+    LLM_CACHE_PATH = "~/.cache/news_portal/llm_responses.sqlite"
+    
+    # Generated cover images keyed by engine, prompt, size and quality. Entries hold
+    # the Cloudinary URL and local file, so they outlive the expiring OpenAI URL
+    IMAGE_CACHE_PATH = "~/.cache/news_portal/generated_images.sqlite"
+    IMAGE_CACHE_TTL_SECONDS = 7 * 24 * 3600
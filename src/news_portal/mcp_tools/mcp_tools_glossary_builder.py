@@ -18,41 +18,44 @@ logger = logging.getLogger(__name__)
 class GlossaryBuilderTool(BaseMCPTool):
     """MCP Tool for building high-value glossaries using knowledge graph centrality."""
     
+    # Static schema (depends only on Config), built once per class
+    _TOOL_DEFINITION = {
+        "name": "build_glossary",
+        "description": "Build high-value glossary using knowledge graph centrality measures",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain": {
+                    "type": "string",
+                    "description": "Domain name for knowledge graph lookup"
+                },
+                "max_terms": {
+                    "type": "integer",
+                    "default": Config.DEFAULT_MAX_GLOSSARY_TERMS,
+                    "description": "Maximum number of glossary terms"
+                },
+                "min_centrality": {
+                    "type": "number",
+                    "default": Config.DEFAULT_MIN_CENTRALITY,
+                    "description": "Minimum centrality threshold"
+                },
+                "include_definitions": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Include AI-generated definitions"
+                }
+            },
+            "required": ["domain"]
+        }
+    }
+    
     def __init__(self, openai_client=None):
         super().__init__(openai_client)
         self.llm_processor = LLMProcessor(self.openai_client)
     
     def get_tool_definition(self) -> Dict[str, Any]:
         """Return the MCP tool definition."""
-        return {
-            "name": "build_glossary",
-            "description": "Build high-value glossary using knowledge graph centrality measures",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "domain": {
-                        "type": "string",
-                        "description": "Domain name for knowledge graph lookup"
-                    },
-                    "max_terms": {
-                        "type": "integer",
-                        "default": Config.DEFAULT_MAX_GLOSSARY_TERMS,
-                        "description": "Maximum number of glossary terms"
-                    },
-                    "min_centrality": {
-                        "type": "number",
-                        "default": Config.DEFAULT_MIN_CENTRALITY,
-                        "description": "Minimum centrality threshold"
-                    },
-                    "include_definitions": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Include AI-generated definitions"
-                    }
-                },
-                "required": ["domain"]
-            }
-        }
+        return self._TOOL_DEFINITION
     
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute the glossary building tool."""
@@ -73,22 +76,18 @@ class GlossaryBuilderTool(BaseMCPTool):
             
             kg = self.knowledge_graphs[domain]
             
-            # Step 1: Get top nodes by centrality
-            top_nodes = sorted(
-                [(k, v) for k, v in kg.nodes.items()],
-                key=lambda x: x[1].centrality_score,
-                reverse=True
-            )[:max_terms]
+            # Step 1-2: Get top nodes by centrality above the threshold
+            filtered_nodes = kg.top_nodes(max_terms, min_centrality)
             
-            # Step 2: Filter by centrality threshold
-            filtered_nodes = [
-                (k, v) for k, v in top_nodes 
-                if v.centrality_score >= min_centrality
-            ]
+            # Step 3: Generate definitions if requested (several terms per LLM request)
+            definitions = {}
+            if include_definitions and filtered_nodes:
+                definitions = await self.llm_processor.generate_definitions_batch(
+                    [node.label for node in filtered_nodes], domain, kg
+                )
             
-            # Step 3: Generate definitions if requested
             glossary_terms = []
-            for node_id, node in filtered_nodes:
+            for node in filtered_nodes:
                 term_data = {
                     "term": node.label,
                     "centrality_score": node.centrality_score,
@@ -96,10 +95,7 @@ class GlossaryBuilderTool(BaseMCPTool):
                 }
                 
                 if include_definitions:
-                    definition = await self.llm_processor.generate_definition(
-                        node.label, domain, kg
-                    )
-                    term_data["definition"] = definition
+                    term_data["definition"] = definitions.get(node.label, "")
                 
                 glossary_terms.append(term_data)
             
@@ -18,40 +18,43 @@ logger = logging.getLogger(__name__)
 class KeywordExtractorTool(BaseMCPTool):
     """MCP Tool for extracting high-centrality keywords from text."""
     
+    # Static schema (depends only on Config), built once per class
+    _TOOL_DEFINITION = {
+        "name": "extract_keywords",
+        "description": "Extract high-centrality keywords from text using knowledge graph",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to extract keywords from"
+                },
+                "domain": {
+                    "type": "string",
+                    "description": "Domain name for knowledge graph lookup"
+                },
+                "max_keywords": {
+                    "type": "integer",
+                    "default": Config.DEFAULT_MAX_KEYWORDS,
+                    "description": "Maximum number of keywords to return"
+                },
+                "min_centrality": {
+                    "type": "number",
+                    "default": 0.05,
+                    "description": "Minimum centrality threshold"
+                }
+            },
+            "required": ["text", "domain"]
+        }
+    }
+    
     def __init__(self, openai_client=None):
         super().__init__(openai_client)
         self.llm_processor = LLMProcessor(self.openai_client)
     
     def get_tool_definition(self) -> Dict[str, Any]:
         """Return the MCP tool definition."""
-        return {
-            "name": "extract_keywords",
-            "description": "Extract high-centrality keywords from text using knowledge graph",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Text to extract keywords from"
-                    },
-                    "domain": {
-                        "type": "string",
-                        "description": "Domain name for knowledge graph lookup"
-                    },
-                    "max_keywords": {
-                        "type": "integer",
-                        "default": Config.DEFAULT_MAX_KEYWORDS,
-                        "description": "Maximum number of keywords to return"
-                    },
-                    "min_centrality": {
-                        "type": "number",
-                        "default": 0.05,
-                        "description": "Minimum centrality threshold"
-                    }
-                },
-                "required": ["text", "domain"]
-            }
-        }
+        return self._TOOL_DEFINITION
     
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute the keyword extraction tool."""
@@ -76,19 +79,7 @@ class KeywordExtractorTool(BaseMCPTool):
             candidate_keywords = await self.llm_processor.extract_candidate_keywords(text)
             
             # Step 2: Match against knowledge graph nodes
-            matched_keywords = []
-            for keyword in candidate_keywords:
-                keyword_lower = keyword.lower()
-                for node_id, node in kg.nodes.items():
-                    if (keyword_lower in node.label.lower() or 
-                        node.label.lower() in keyword_lower):
-                        matched_keywords.append({
-                            "keyword": keyword,
-                            "node_id": node_id,
-                            "centrality_score": node.centrality_score,
-                            "node_label": node.label
-                        })
-                        break
+            matched_keywords = self.match_keywords_against_graph(candidate_keywords, kg)
             
             # Step 3: Sort by centrality and filter
             matched_keywords.sort(key=lambda x: x["centrality_score"], reverse=True)
@@ -125,18 +116,16 @@ class KeywordExtractorTool(BaseMCPTool):
         """Match keywords against knowledge graph nodes."""
         matched_keywords = []
         
+        # Label lookups go through the graph's cached label/word indexes
         for keyword in keywords:
-            keyword_lower = keyword.lower()
-            for node_id, node in kg.nodes.items():
-                if (keyword_lower in node.label.lower() or 
-                    node.label.lower() in keyword_lower):
-                    matched_keywords.append({
-                        "keyword": keyword,
-                        "node_id": node_id,
-                        "centrality_score": node.centrality_score,
-                        "node_label": node.label
-                    })
-                    break
+            node = kg.match_node(keyword)
+            if node is not None:
+                matched_keywords.append({
+                    "keyword": keyword,
+                    "node_id": node.id,
+                    "centrality_score": node.centrality_score,
+                    "node_label": node.label
+                })
         
         return matched_keywords
     
@@ -10,6 +10,7 @@ Available Tests:
 - test_glossary_builder.py: Comprehensive glossary builder tests
 - test_keyword_extractor.py: Keyword extractor tests
 - view_generated_images.py: Cover image generation and viewing demo
+- _env.py: Shared .env loader (parsed once per process)
 """
 
 __version__ = "1.0.0"
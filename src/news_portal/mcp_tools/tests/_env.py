@@ -0,0 +1,45 @@
+"""
+Environment loading shared by the MCP tool test scripts.
+
+The project .env file is parsed once per process, however many test
+modules ask for it.
+"""
+
+import os
+import sys
+from functools import cache
+from pathlib import Path
+
+# Repository root (src/news_portal/mcp_tools/tests/_env.py -> 4 levels up)
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+@cache
+def load_env():
+    """Load the project .env file once and return OPENAI_API_KEY (or None)."""
+    try:
+        from dotenv import load_dotenv
+        env_file = PROJECT_ROOT / ".env"
+        if env_file.exists():
+            load_dotenv(env_file)
+            print(f"✅ Loaded environment variables from: {env_file}")
+        else:
+            print(f"⚠️  .env file not found at: {env_file}")
+    except ImportError:
+        print("⚠️  python-dotenv not installed")
+    return os.environ.get("OPENAI_API_KEY")
+
+@cache
+def require_openai_key():
+    """
+    Stop the test script if OPENAI_API_KEY is not configured.
+    
+    Under pytest the calling module is skipped instead of exiting, so
+    collection carries on; as a script it exits with status 1.
+    """
+    if not load_env():
+        print("❌ OPENAI_API_KEY not found!")
+        if "pytest" in sys.modules:
+            import pytest
+            pytest.skip("OPENAI_API_KEY not configured", allow_module_level=True)
+        sys.exit(1)
+    print("✅ OPENAI_API_KEY found")
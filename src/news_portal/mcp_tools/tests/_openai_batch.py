@@ -0,0 +1,120 @@
+"""
+OpenAI Batch API client for offline test runs.
+
+With OPENAI_USE_BATCH=1 the test scripts hand the tools a client whose
+chat.completions.create() queues the request instead of sending it. The
+requests queued within a short window are uploaded as one JSONL file and
+submitted to the Batch endpoint (half the per-token cost, 24h completion
+window). Each caller then gets back its own ChatCompletion once the batch
+finishes. Anything other than chat completions goes to the wrapped client
+unchanged.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+
+# How long to keep collecting requests before submitting a batch
+BATCH_COLLECT_SECONDS = float(os.getenv("OPENAI_BATCH_COLLECT_SECONDS", "2.0"))
+# How often to poll a submitted batch
+BATCH_POLL_SECONDS = float(os.getenv("OPENAI_BATCH_POLL_SECONDS", "30"))
+
+_TERMINAL_BATCH_STATES = ("completed", "failed", "expired", "cancelled")
+
+async def wait_for_batch(client: AsyncOpenAI, batch_id: str, poll_seconds: float = BATCH_POLL_SECONDS):
+    """Poll a batch until it reaches a terminal state and return it."""
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status in _TERMINAL_BATCH_STATES:
+            return batch
+        print(f"⏳ Batch {batch_id}: {batch.status} ({batch.request_counts.completed}/{batch.request_counts.total})")
+        await asyncio.sleep(poll_seconds)
+
+class _BatchCompletions:
+    """Stand-in for client.chat.completions that queues requests into batches."""
+
+    def __init__(self, client: AsyncOpenAI):
+        self._client = client
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def create(self, **kwargs) -> ChatCompletion:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((kwargs, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(BATCH_COLLECT_SECONDS)
+        pending, self._pending, self._flush_task = self._pending, [], None
+        try:
+            await self._run_batch(pending)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _run_batch(self, pending: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        lines = b"\n".join(
+            orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            })
+            for i, (body, _) in enumerate(pending)
+        )
+        batch_file = await self._client.files.create(file=("requests.jsonl", lines), purpose="batch")
+        batch = await self._client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📦 Submitted batch {batch.id} with {len(pending)} requests")
+
+        batch = await wait_for_batch(self._client, batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status: {batch.status}")
+
+        output = await self._client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            _, future = pending[int(record["custom_id"])]
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                future.set_result(ChatCompletion.model_validate(response["body"]))
+            else:
+                future.set_exception(RuntimeError(f"Batch request failed: {record.get('error') or response}"))
+
+        # Requests missing from the output file (e.g. listed only in the error file)
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError(f"No result for request in batch {batch.id}"))
+
+class _BatchChat:
+    def __init__(self, client: AsyncOpenAI):
+        self.completions = _BatchCompletions(client)
+
+class BatchOpenAIClient:
+    """AsyncOpenAI wrapper that routes chat completions through the Batch API."""
+
+    def __init__(self, client: AsyncOpenAI = None):
+        self._client = client or AsyncOpenAI()
+        self.chat = _BatchChat(self._client)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+def openai_client_from_env() -> Optional[Any]:
+    """Return a BatchOpenAIClient when OPENAI_USE_BATCH=1, else None (tools use their default client)."""
+    if os.getenv("OPENAI_USE_BATCH") == "1":
+        print("📦 OPENAI_USE_BATCH=1: chat completions go through the OpenAI Batch API")
+        return BatchOpenAIClient()
+    return None
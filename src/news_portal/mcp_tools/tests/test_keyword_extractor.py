@@ -7,29 +7,21 @@ Comprehensive tests for the KeywordExtractorTool.
 """
 
 import asyncio
+import heapq
+import logging
+import operator
 import sys
 import os
 from pathlib import Path
 
-# Load environment variables
+logger = logging.getLogger("kw_test")
+
+# Load environment variables (parsed once per process) and check API key
 try:
-    from dotenv import load_dotenv
-    project_root = Path(__file__).parent.parent.parent.parent.parent
-    env_file = project_root / '.env'
-    if env_file.exists():
-        load_dotenv(env_file)
-        print(f"✅ Loaded environment variables from: {env_file}")
-    else:
-        print(f"⚠️  .env file not found at: {env_file}")
+    from ._env import require_openai_key
 except ImportError:
-    print("⚠️  python-dotenv not installed")
-
-# Check API key
-if not os.getenv("OPENAI_API_KEY"):
-    print("❌ OPENAI_API_KEY not found!")
-    sys.exit(1)
-else:
-    print("✅ OPENAI_API_KEY found")
+    from _env import require_openai_key
+require_openai_key()
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
@@ -37,10 +29,37 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 from news_portal.mcp_tools import KeywordExtractorTool
 from news_portal.mcp_tools.knowledge_graph_builder import KnowledgeGraphBuilderTool
 
+# Pre-built graph (tests -> mcp_tools/knowledge_graphs)
+PREBUILT_GRAPH_FILE = Path(__file__).resolve().parents[1] / "knowledge_graphs" / "cancer_health_care.json"
+
+# Source documents for the dynamically built test graphs. Kept as immutable
+# module constants so they hash identically across runs.
+CANCER_DOCUMENTS = (
+    "Precision oncology uses genetic testing to personalize cancer treatment.",
+    "Immunotherapy helps the immune system fight cancer cells effectively.",
+    "Targeted therapies attack specific molecular pathways in cancer cells.",
+    "Biomarkers predict treatment response and disease progression.",
+    "Early detection improves cancer survival rates significantly.",
+    "Liquid biopsies detect cancer DNA in blood samples non-invasively.",
+    "CAR-T cell therapy engineers immune cells to target cancer.",
+    "Checkpoint inhibitors remove brakes on immune system responses.",
+)
+
+FINANCE_DOCUMENTS = (
+    "Cryptocurrency markets are highly volatile and speculative.",
+    "Central banks use monetary policy to control inflation rates.",
+    "Algorithmic trading uses computer programs to execute trades.",
+    "Risk management protects portfolios from market downturns.",
+    "Blockchain technology enables secure digital transactions.",
+)
+
+def _banner(title: str, rule: str = "-", width: int = 40):
+    """Log a section heading followed by a horizontal rule."""
+    logger.info("\n%s\n%s", title, rule * width)
+
 async def test_keyword_extraction():
     """Test keyword extraction with various scenarios."""
-    print("\n🔍 Keyword Extractor Tool Test Suite")
-    print("=" * 60)
+    _banner("🔍 Keyword Extractor Tool Test Suite", "=", 60)
     
     kw_tool = KeywordExtractorTool()
     kg_loader = KnowledgeGraphBuilderTool()
@@ -48,12 +67,10 @@ async def test_keyword_extraction():
     kg = None  # Initialize kg to None
     
     # Load pre-built knowledge graph for cancer health care
-    print("\n🔧 Loading pre-built knowledge graph for 'cancer health care'...")
-    # Path from tests to mcp_tools/knowledge_graphs
-    graph_file = Path(__file__).parent.parent / "knowledge_graphs" / "cancer_health_care.json"
+    logger.info("\n🔧 Loading pre-built knowledge graph for 'cancer health care'...")
     
-    if graph_file.exists():
-        success = kg_loader.load_graph(str(graph_file))
+    if PREBUILT_GRAPH_FILE.exists():
+        success = kg_loader.load_graph(str(PREBUILT_GRAPH_FILE))
         if success:
             kg = kg_loader.get_knowledge_graph("cancer health care")
             if kg:
@@ -62,58 +79,56 @@ async def test_keyword_extraction():
                     "cancer health care": kg,
                     "cancer_care": kg  # For backward compatibility
                 })
-                print(f"✅ Loaded knowledge graph: {len(kg.nodes)} nodes, {len(kg.edges)} edges")
+                logger.info("✅ Loaded knowledge graph: %d nodes, %d edges", len(kg.nodes), len(kg.edges))
             else:
-                print("⚠️  Failed to retrieve loaded graph")
+                logger.warning("⚠️  Failed to retrieve loaded graph")
         else:
-            print("⚠️  Failed to load graph from file")
+            logger.warning("⚠️  Failed to load graph from file")
     else:
-        print(f"⚠️  Pre-built graph not found at: {graph_file}")
-        print("   Run 'uv run python src/news_portal/mcp_tools/build_knowledge_graph.py' to create it")
+        logger.warning("⚠️  Pre-built graph not found at: %s", PREBUILT_GRAPH_FILE)
+        logger.warning("   Run 'uv run python src/news_portal/mcp_tools/build_knowledge_graph.py' to create it")
     
     # Test 1: Extract keywords using pre-built or dynamically built knowledge graph
-    print("\n🧠 Test 1: Keyword Extraction with Knowledge Graph")
-    print("-" * 40)
+    _banner("🧠 Test 1: Keyword Extraction with Knowledge Graph")
     
     # Use the pre-built graph if available, otherwise build dynamically
     use_prebuilt = kg is not None and len(kg.nodes) > 0
     
+    # The finance graph for Test 4 is independent, so build it alongside the tests below
+    logger.info("🔧 Building knowledge graph for finance domain in the background...")
+    finance_task = asyncio.create_task(kg_tool.execute(
+        domain="finance",
+        documents=list(FINANCE_DOCUMENTS),
+        max_nodes=10,
+        min_centrality=0.05
+    ))
+    
     if not use_prebuilt:
-        print("⚠️  No pre-built graph loaded. Building dynamic graph for test purposes...")
+        logger.warning("⚠️  No pre-built graph loaded. Building dynamic graph for test purposes...")
         # Build knowledge graph for cancer care
-        cancer_documents = [
-            "Precision oncology uses genetic testing to personalize cancer treatment.",
-            "Immunotherapy helps the immune system fight cancer cells effectively.",
-            "Targeted therapies attack specific molecular pathways in cancer cells.",
-            "Biomarkers predict treatment response and disease progression.",
-            "Early detection improves cancer survival rates significantly.",
-            "Liquid biopsies detect cancer DNA in blood samples non-invasively.",
-            "CAR-T cell therapy engineers immune cells to target cancer.",
-            "Checkpoint inhibitors remove brakes on immune system responses."
-        ]
-        
-        print("🔧 Building knowledge graph for cancer_care domain...")
+        logger.info("🔧 Building knowledge graph for cancer_care domain...")
         kg_result = await kg_tool.execute(
             domain="cancer_care",
-            documents=cancer_documents,
+            documents=list(CANCER_DOCUMENTS),
             max_nodes=15,
             min_centrality=0.05
         )
         
         if kg_result.get('status') == 'success':
-            print(f"✅ Knowledge graph built: {kg_result.get('nodes_count')} nodes, {kg_result.get('edges_count')} edges")
+            logger.info("✅ Knowledge graph built: %s nodes, %s edges", kg_result.get('nodes_count'), kg_result.get('edges_count'))
             kg = kg_tool.get_knowledge_graph("cancer_care")
             kw_tool.set_knowledge_graphs({"cancer_care": kg})
         else:
-            print(f"❌ Failed to build knowledge graph: {kg_result.get('message')}")
+            logger.error("❌ Failed to build knowledge graph: %s", kg_result.get('message'))
+            finance_task.cancel()
             return
     else:
-        print("✅ Using pre-built knowledge graph from startup")
+        logger.info("✅ Using pre-built knowledge graph from startup")
     
     # Test keyword extraction
     test_text = "Precision oncology and immunotherapy are revolutionizing cancer treatment through personalized approaches that target specific molecular pathways."
     
-    print(f"\n📝 Extracting keywords from: {test_text}")
+    logger.info("\n📝 Extracting keywords from: %s", test_text)
     
     result = await kw_tool.execute(
         text=test_text,
@@ -122,24 +137,23 @@ async def test_keyword_extraction():
         min_centrality=0.01
     )
     
-    print(f"📊 Result: {result.get('status')}")
+    logger.info("📊 Result: %s", result.get('status'))
     if result.get('status') == 'success':
         keywords = result.get('keywords', [])
-        print(f"✅ Extracted {len(keywords)} keywords:")
+        logger.info("✅ Extracted %d keywords:", len(keywords))
         for i, kw in enumerate(keywords, 1):
-            print(f"  {i}. {kw.get('keyword')} (centrality: {kw.get('centrality_score', 0):.3f})")
+            logger.info("  %d. %s (centrality: %.3f)", i, kw.get('keyword'), kw.get('centrality_score', 0))
     else:
-        print(f"❌ Error: {result.get('message')}")
+        logger.error("❌ Error: %s", result.get('message'))
     
     # Test 2: Without knowledge graph (should fail)
-    print("\n❌ Test 2: Without Knowledge Graph (Expected Failure)")
-    print("-" * 40)
+    _banner("❌ Test 2: Without Knowledge Graph (Expected Failure)")
     
     kw_tool_no_kg = KeywordExtractorTool()  # Fresh instance without KG
     
     test_text = "Machine learning algorithms are transforming healthcare through predictive analytics."
     
-    print(f"📝 Extracting keywords from: {test_text}")
+    logger.info("📝 Extracting keywords from: %s", test_text)
     
     result = await kw_tool_no_kg.execute(
         text=test_text,
@@ -148,46 +162,27 @@ async def test_keyword_extraction():
         min_centrality=0.05
     )
     
-    print(f"📊 Result: {result.get('status')}")
+    logger.info("📊 Result: %s", result.get('status'))
     if result.get('status') == 'error':
-        print(f"✅ Expected failure: {result.get('message')}")
+        logger.info("✅ Expected failure: %s", result.get('message'))
     else:
-        print(f"❌ Unexpected success: {result.get('message')}")
+        logger.error("❌ Unexpected success: %s", result.get('message'))
     
     # Test 3: Different centrality thresholds
-    print("\n📊 Test 3: Different Centrality Thresholds")
-    print("-" * 40)
+    _banner("📊 Test 3: Different Centrality Thresholds")
     
     test_text = "Precision oncology uses genetic testing, immunotherapy, and targeted therapies to treat cancer patients."
     
     thresholds = [0.05, 0.1, 0.15, 0.2]
     
+    # The graph was set on kw_tool in Test 1, so report its top nodes once
+    kg = kw_tool.knowledge_graphs["cancer_care"]
+    top_nodes = heapq.nlargest(3, kg.nodes.values(), key=operator.attrgetter('centrality_score'))
+    logger.info("📊 Knowledge graph: %d nodes", len(kg.nodes))
+    logger.info("📊 Top nodes: %s", [f'{n.label}({n.centrality_score:.3f})' for n in top_nodes])
+    
     for threshold in thresholds:
-        print(f"\n🔍 Testing threshold: {threshold}")
-        
-        # Debug: Check if knowledge graph is still available
-        try:
-            # Try to access the knowledge graph directly
-            if hasattr(kw_tool, 'knowledge_graphs') and "cancer_care" in kw_tool.knowledge_graphs:
-                kg = kw_tool.knowledge_graphs["cancer_care"]
-                print(f"  📊 Knowledge graph available: {len(kg.nodes)} nodes")
-                # Show top nodes
-                sorted_nodes = sorted(kg.nodes.values(), key=lambda x: x.centrality_score, reverse=True)
-                print(f"  📊 Top nodes: {[f'{n.label}({n.centrality_score:.3f})' for n in sorted_nodes[:3]]}")
-            else:
-                print(f"  ❌ Knowledge graph NOT available!")
-                # Re-set the knowledge graph using kg_tool
-                kg = kg_tool.get_knowledge_graph("cancer_care")
-                if kg:
-                    kw_tool.set_knowledge_graphs({"cancer_care": kg})
-                    print(f"  🔧 Re-set knowledge graph: {len(kg.nodes)} nodes")
-        except Exception as e:
-            print(f"  ❌ Error checking knowledge graph: {e}")
-            # Re-set the knowledge graph using kg_tool
-            kg = kg_tool.get_knowledge_graph("cancer_care")
-            if kg:
-                kw_tool.set_knowledge_graphs({"cancer_care": kg})
-                print(f"  🔧 Re-set knowledge graph: {len(kg.nodes)} nodes")
+        logger.info("\n🔍 Testing threshold: %s", threshold)
         
         result = await kw_tool.execute(
             text=test_text,
@@ -198,35 +193,20 @@ async def test_keyword_extraction():
         
         if result.get('status') == 'success':
             keywords = result.get('keywords', [])
-            print(f"✅ Threshold {threshold}: {len(keywords)} keywords")
+            logger.info("✅ Threshold %s: %d keywords", threshold, len(keywords))
             if keywords:
-                print(f"   Top keyword: {keywords[0].get('keyword')} ({keywords[0].get('centrality_score', 0):.3f})")
+                logger.info("   Top keyword: %s (%.3f)", keywords[0].get('keyword'), keywords[0].get('centrality_score', 0))
         else:
-            print(f"❌ Threshold {threshold}: {result.get('message')}")
+            logger.error("❌ Threshold %s: %s", threshold, result.get('message'))
     
     # Test 4: Different domains
-    print("\n🌐 Test 4: Different Domains")
-    print("-" * 40)
+    _banner("🌐 Test 4: Different Domains")
     
-    # Build knowledge graph for finance
-    finance_documents = [
-        "Cryptocurrency markets are highly volatile and speculative.",
-        "Central banks use monetary policy to control inflation rates.",
-        "Algorithmic trading uses computer programs to execute trades.",
-        "Risk management protects portfolios from market downturns.",
-        "Blockchain technology enables secure digital transactions."
-    ]
-    
-    print("🔧 Building knowledge graph for finance domain...")
-    kg_result = await kg_tool.execute(
-        domain="finance",
-        documents=finance_documents,
-        max_nodes=10,
-        min_centrality=0.05
-    )
+    # Collect the finance knowledge graph started before Test 1
+    kg_result = await finance_task
     
     if kg_result.get('status') == 'success':
-        print(f"✅ Knowledge graph built: {kg_result.get('nodes_count')} nodes, {kg_result.get('edges_count')} edges")
+        logger.info("✅ Knowledge graph built: %s nodes, %s edges", kg_result.get('nodes_count'), kg_result.get('edges_count'))
         
         # Set the knowledge graph for the keyword extractor
         kg = kg_tool.get_knowledge_graph("finance")
@@ -235,7 +215,7 @@ async def test_keyword_extraction():
         # Test keyword extraction
         finance_text = "Cryptocurrency trading and blockchain technology are revolutionizing financial markets through decentralized systems."
         
-        print(f"\n📝 Extracting keywords from finance text: {finance_text}")
+        logger.info("\n📝 Extracting keywords from finance text: %s", finance_text)
         
         result = await kw_tool.execute(
             text=finance_text,
@@ -244,59 +224,60 @@ async def test_keyword_extraction():
             min_centrality=0.05
         )
         
-        print(f"📊 Result: {result.get('status')}")
+        logger.info("📊 Result: %s", result.get('status'))
         if result.get('status') == 'success':
             keywords = result.get('keywords', [])
-            print(f"✅ Extracted {len(keywords)} keywords:")
+            logger.info("✅ Extracted %d keywords:", len(keywords))
             for i, kw in enumerate(keywords, 1):
-                print(f"  {i}. {kw.get('keyword')} (centrality: {kw.get('centrality_score', 0):.3f})")
+                logger.info("  %d. %s (centrality: %.3f)", i, kw.get('keyword'), kw.get('centrality_score', 0))
         else:
-            print(f"❌ Error: {result.get('message')}")
+            logger.error("❌ Error: %s", result.get('message'))
     else:
-        print(f"❌ Failed to build finance knowledge graph: {kg_result.get('message')}")
+        logger.error("❌ Failed to build finance knowledge graph: %s", kg_result.get('message'))
     
     # Test 5: Edge cases
-    print("\n🔍 Test 5: Edge Cases")
-    print("-" * 40)
+    _banner("🔍 Test 5: Edge Cases")
     
     # Empty text
-    print("\n📝 Testing empty text...")
+    logger.info("\n📝 Testing empty text...")
     result = await kw_tool.execute(
         text="",
         domain="cancer_care",
         max_keywords=5,
         min_centrality=0.05
     )
-    print(f"📊 Empty text result: {result.get('status')}")
+    logger.info("📊 Empty text result: %s", result.get('status'))
     
     # Very short text
-    print("\n📝 Testing very short text...")
+    logger.info("\n📝 Testing very short text...")
     result = await kw_tool.execute(
         text="AI",
         domain="cancer_care",
         max_keywords=5,
         min_centrality=0.05
     )
-    print(f"📊 Short text result: {result.get('status')}")
+    logger.info("📊 Short text result: %s", result.get('status'))
     
     # High centrality threshold
-    print("\n📝 Testing high centrality threshold...")
+    logger.info("\n📝 Testing high centrality threshold...")
     result = await kw_tool.execute(
         text="Precision oncology uses genetic testing to personalize cancer treatment.",
         domain="cancer_care",
         max_keywords=5,
         min_centrality=0.5  # Very high threshold
     )
-    print(f"📊 High threshold result: {result.get('status')}")
+    logger.info("📊 High threshold result: %s", result.get('status'))
     if result.get('status') == 'success':
         keywords = result.get('keywords', [])
-        print(f"✅ High threshold: {len(keywords)} keywords")
+        logger.info("✅ High threshold: %d keywords", len(keywords))
     
-    print(f"\n🎉 Keyword Extractor testing completed!")
-    print(f"💡 Tested scenarios: with KG, without KG, different thresholds, different domains, edge cases")
+    logger.info("\n🎉 Keyword Extractor testing completed!")
+    logger.info("💡 Tested scenarios: with KG, without KG, different thresholds, different domains, edge cases")
 
 async def main():
     await test_keyword_extraction()
 
 if __name__ == "__main__":
+    # Plain message logging when run as a script; under pytest, pyproject.toml configures it
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -6,10 +6,9 @@ Test Utilities for MCP Tools
 Common utilities for MCP tool testing.
 """
 
-import os
 import sys
 import logging
-from pathlib import Path
+from functools import cache
 
 # Configure logging for tests
 logging.basicConfig(
@@ -18,22 +17,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@cache
 def setup_test_environment():
-    """Set up test environment and load variables."""
+    """Set up test environment and load variables (once per process)."""
     try:
-        from dotenv import load_dotenv
-        project_root = Path(__file__).parent.parent.parent.parent.parent
-        env_file = project_root / ".env"
-        if env_file.exists():
-            load_dotenv(env_file)
-            logger.info(f"Loaded environment variables from: {env_file}")
-        else:
-            logger.warning(f".env file not found at: {env_file}")
+        from ._env import load_env
     except ImportError:
-        logger.warning("python-dotenv not installed")
+        from _env import load_env
 
-    # Check API key
-    if not os.getenv("OPENAI_API_KEY"):
+    # Check API key (.env is only parsed on the first call)
+    if not load_env():
         logger.error("OPENAI_API_KEY not found!")
         sys.exit(1)
     else:
@@ -42,38 +35,38 @@ def setup_test_environment():
 def log_test_result(test_name: str, result: dict):
     """Log test results in a consistent format."""
     status = result.get('status', 'unknown')
-    logger.info(f"Test '{test_name}': {status}")
+    logger.info("Test '%s': %s", test_name, status)
     
     if status == 'success':
-        logger.info(f"✅ Success: {result.get('message', 'No message')}")
+        logger.info("✅ Success: %s", result.get('message', 'No message'))
     else:
-        logger.error(f"❌ Error: {result.get('message', 'Unknown error')}")
+        logger.error("❌ Error: %s", result.get('message', 'Unknown error'))
 
 def log_knowledge_graph_stats(result: dict):
     """Log knowledge graph statistics."""
     if result.get('status') == 'success':
-        logger.info(f"📊 KG Stats: {result.get('nodes_count', 0)} nodes, {result.get('edges_count', 0)} edges")
+        logger.info("📊 KG Stats: %s nodes, %s edges", result.get('nodes_count', 0), result.get('edges_count', 0))
         
         top_nodes = result.get('top_nodes', [])
         if top_nodes:
             logger.info("📋 Top nodes by centrality:")
             for i, (node_id, score) in enumerate(top_nodes[:5], 1):
-                logger.info(f"  {i}. {node_id} (centrality: {score:.3f})")
+                logger.info("  %s. %s (centrality: %.3f)", i, node_id, score)
 
 def log_keywords(keywords: list, max_show: int = 5):
     """Log extracted keywords."""
     if keywords:
-        logger.info(f"🔍 Extracted {len(keywords)} keywords:")
+        logger.info("🔍 Extracted %s keywords:", len(keywords))
         for i, kw in enumerate(keywords[:max_show], 1):
-            logger.info(f"  {i}. {kw.get('keyword', 'N/A')} (centrality: {kw.get('centrality_score', 0):.3f})")
+            logger.info("  %s. %s (centrality: %.3f)", i, kw.get('keyword', 'N/A'), kw.get('centrality_score', 0))
 
 def log_glossary_terms(terms: list, max_show: int = 3):
     """Log glossary terms."""
     if terms:
-        logger.info(f"📚 Built glossary with {len(terms)} terms:")
+        logger.info("📚 Built glossary with %s terms:", len(terms))
         for i, term in enumerate(terms[:max_show], 1):
             term_name = term.get('term', 'N/A')
             centrality = term.get('centrality_score', 0)
             definition = term.get('definition', 'No definition')
-            logger.info(f"  {i}. {term_name} (centrality: {centrality:.3f})")
-            logger.info(f"     Definition: {definition[:100]}...")
+            logger.info("  %s. %s (centrality: %.3f)", i, term_name, centrality)
+            logger.info("     Definition: %s...", definition[:100])
@@ -7,56 +7,99 @@ Simple script to download and display generated cover images from the FastMCP se
 """
 
 import asyncio
-import sys
+import hashlib
+import sqlite3
 import os
-import requests
+import aiohttp
 import webbrowser
+from contextlib import closing
 from pathlib import Path
 from datetime import datetime
 
-# Load environment variables
+# Load environment variables (parsed once per process) and check API key
 try:
-    from dotenv import load_dotenv
-    project_root = Path(__file__).parent.parent.parent.parent.parent
-    env_file = project_root / ".env"
-    if env_file.exists():
-        load_dotenv(env_file)
-        print(f"✅ Loaded environment variables from: {env_file}")
-    else:
-        print(f"⚠️  .env file not found at: {env_file}")
+    from ._env import require_openai_key
 except ImportError:
-    print("⚠️  python-dotenv not installed")
-
-# Check API key
-if not os.getenv("OPENAI_API_KEY"):
-    print("❌ OPENAI_API_KEY not found!")
-    sys.exit(1)
-else:
-    print("✅ OPENAI_API_KEY found")
+    from _env import require_openai_key
+require_openai_key()
 
 from fastmcp import Client
-import json
+import orjson
 
 def parse_fastmcp_result(result):
     """Parse FastMCP result and return as dictionary."""
+    # Dict-returning tools also send structured content, already decoded by the client
+    structured = getattr(result, 'structured_content', None)
+    if isinstance(structured, dict):
+        return structured
     if hasattr(result, 'content') and result.content:
         result_data = result.content[0].text
         try:
-            return json.loads(result_data)
-        except json.JSONDecodeError:
+            return orjson.loads(result_data)
+        except orjson.JSONDecodeError:
             return {"status": "error", "message": f"Could not parse JSON: {result_data}"}
     else:
         return {"status": "error", "message": "No content in result"}
 
-def download_and_display_image(image_url, filename=None):
-    """Download image from URL and display it."""
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Editorial texts used for the demo generations. Module constants so the
+# cover cache key below is stable across runs.
+COVER_EDITORIAL_TEXT = """
+            The future of cancer care is being transformed by precision oncology approaches 
+            that combine advanced diagnostics like molecular profiling and liquid biopsies 
+            with innovative treatments such as immunotherapy. Early detection remains paramount, 
+            and multidisciplinary approaches are key to improving patient outcomes and addressing 
+            previously untreatable or metastatic cancers.
+            """
+
+STYLES_EDITORIAL_TEXT = """
+            Precision oncology represents a paradigm shift in cancer treatment, 
+            moving from one-size-fits-all approaches to personalized therapies 
+            based on individual genetic profiles and molecular characteristics.
+            """
+
+# Persistent cache of generated covers, keyed by a hash of the request payload
+COVER_CACHE_PATH = Path.home() / ".cache" / "news_portal" / "dalle_cache.sqlite"
+
+def cover_cache_key(editorial_text, domain, style, dimensions):
+    """Content-addressed key for a cover image request."""
+    payload = {"t": editorial_text, "d": domain, "s": style, "dim": dimensions}
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def _open_cover_cache():
+    COVER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(COVER_CACHE_PATH)
+    conn.execute("CREATE TABLE IF NOT EXISTS covers (key TEXT PRIMARY KEY, url TEXT, local TEXT)")
+    return conn
+
+def get_cached_cover(key):
+    """Return the cached {url, local} entry for a request if its image is still on disk."""
+    with closing(_open_cover_cache()) as conn:
+        row = conn.execute("SELECT url, local FROM covers WHERE key = ?", (key,)).fetchone()
+    if row and row[1] and Path(row[1]).exists():
+        return {"url": row[0], "local": row[1]}
+    return None
+
+def store_cached_cover(key, url, local):
+    """Record the image URL and downloaded file for a request."""
+    with closing(_open_cover_cache()) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO covers (key, url, local) VALUES (?, ?, ?)", (key, url, local))
+
+def open_image(filepath):
+    """Open a local image in the default browser."""
+    try:
+        webbrowser.open(f"file://{Path(filepath).absolute()}")
+        print(f"🖼️  Image opened in default browser")
+    except Exception as e:
+        print(f"⚠️  Could not open image automatically: {e}")
+        print(f"   You can manually open: {filepath}")
+
+async def download_and_display_image_async(session, image_url, filename=None):
+    """Stream image from URL to disk in chunks and display it."""
     try:
         print(f"\n📥 Downloading image from: {image_url[:100]}...")
         
-        # Download the image
-        response = requests.get(image_url, timeout=30)
-        response.raise_for_status()
-        
         # Create filename if not provided
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -68,23 +111,33 @@ def download_and_display_image(image_url, filename=None):
         
         filepath = images_dir / filename
         
-        with open(filepath, 'wb') as f:
-            f.write(response.content)
+        # Stream the image straight to disk instead of buffering it in memory.
+        # Chunks go to a .tmp sibling that is renamed into place once complete,
+        # so the browser and the cover cache never see a truncated image.
+        tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+        bytes_written = 0
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with session.get(image_url, timeout=timeout) as response:
+            response.raise_for_status()
+            try:
+                with open(tmp_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        bytes_written += len(chunk)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
         
         print(f"✅ Image saved to: {filepath}")
-        print(f"📏 File size: {len(response.content)} bytes")
+        print(f"📏 File size: {bytes_written} bytes")
         
         # Try to open the image
-        try:
-            webbrowser.open(f"file://{filepath.absolute()}")
-            print(f"🖼️  Image opened in default browser")
-        except Exception as e:
-            print(f"⚠️  Could not open image automatically: {e}")
-            print(f"   You can manually open: {filepath}")
+        open_image(filepath)
         
         return str(filepath)
         
-    except requests.exceptions.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"❌ Error downloading image: {e}")
         return None
     except Exception as e:
@@ -104,18 +157,20 @@ async def generate_and_view_image():
             print("✅ Connected to FastMCP server")
             print("ℹ️  Using pre-built knowledge graph loaded at server startup")
             
-            # Test editorial text
-            editorial_text = """
-            The future of cancer care is being transformed by precision oncology approaches 
-            that combine advanced diagnostics like molecular profiling and liquid biopsies 
-            with innovative treatments such as immunotherapy. Early detection remains paramount, 
-            and multidisciplinary approaches are key to improving patient outcomes and addressing 
-            previously untreatable or metastatic cancers.
-            """
+            editorial_text = COVER_EDITORIAL_TEXT
             
             print(f"\n🖼️ Step 2: Generating cover image...")
             print(f"Editorial text: {editorial_text[:100]}...")
             
+            # Skip DALL-E and the download entirely for a previously generated request
+            cache_key = cover_cache_key(editorial_text, "cancer health care", "professional", "1024x1024")
+            cached = get_cached_cover(cache_key)
+            if cached:
+                print(f"♻️  Reusing cached cover image: {cached['url']}")
+                open_image(cached["local"])
+                print(f"📁 Image saved to: {cached['local']}")
+                return
+            
             # Call the generate_cover_image tool
             result = await client.call_tool(
                 "generate_cover_image",
@@ -160,9 +215,11 @@ async def generate_and_view_image():
                 # Download and display the image
                 if image_url:
                     print(f"\n🖼️  Downloading and displaying image...")
-                    filepath = download_and_display_image(image_url)
+                    async with aiohttp.ClientSession() as session:
+                        filepath = await download_and_display_image_async(session, image_url)
                     
                     if filepath:
+                        store_cached_cover(cache_key, image_url, filepath)
                         print(f"\n🎉 Cover image generation and display successful!")
                         print(f"📁 Image saved to: {filepath}")
                     else:
@@ -188,18 +245,22 @@ async def generate_multiple_styles():
     client = Client("http://localhost:8002/mcp")
     
     try:
-        async with client:
+        async with client, aiohttp.ClientSession() as session:
             print("✅ Connected to FastMCP server")
             
-            editorial_text = """
-            Precision oncology represents a paradigm shift in cancer treatment, 
-            moving from one-size-fits-all approaches to personalized therapies 
-            based on individual genetic profiles and molecular characteristics.
-            """
+            editorial_text = STYLES_EDITORIAL_TEXT
             
             for style in styles:
                 print(f"\n🎨 Generating {style} style image...")
                 
+                cache_key = cover_cache_key(editorial_text, "cancer health care", style, "1024x1024")
+                cached = get_cached_cover(cache_key)
+                if cached:
+                    print(f"♻️  Reusing cached {style} image")
+                    open_image(cached["local"])
+                    print(f"📁 Saved: {cached['local']}")
+                    continue
+                
                 result = await client.call_tool(
                     "generate_cover_image",
                     {
@@ -219,9 +280,10 @@ async def generate_multiple_styles():
                     
                     # Download with style-specific filename
                     filename = f"cover_image_{style}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                    filepath = download_and_display_image(image_url, filename)
+                    filepath = await download_and_display_image_async(session, image_url, filename)
                     
                     if filepath:
+                        store_cached_cover(cache_key, image_url, filepath)
                         print(f"📁 Saved: {filepath}")
                 else:
                     print(f"❌ Failed to generate {style} image: {result_dict.get('message')}")
@@ -240,11 +302,19 @@ async def main():
     # Generate and view a single image
     await generate_and_view_image()
     
-    # Ask if user wants to generate multiple styles
+    # Ask if user wants to generate multiple styles. The prompt runs in a worker
+    # thread so the style images can be generated while the user decides.
     print("\n" + "=" * 50)
-    response = input("Would you like to generate images with different styles? (y/n): ")
+    prefetch_task = asyncio.create_task(generate_multiple_styles())
+    response = await asyncio.to_thread(input, "Would you like to generate images with different styles? (y/n): ")
     if response.lower() in ['y', 'yes']:
-        await generate_multiple_styles()
+        await prefetch_task
+    else:
+        prefetch_task.cancel()
+        try:
+            await prefetch_task
+        except asyncio.CancelledError:
+            pass
     
     print("\n✅ Image generation and viewing completed!")
 
@@ -6,9 +6,28 @@ View Knowledge Graph
 Utility to view the pre-built knowledge graph with nodes, edges, and statistics.
 """
 
-import json
+import heapq
 from pathlib import Path
 from collections import defaultdict
+from operator import itemgetter
+
+import ijson
+
+# How many nodes / connected nodes to list
+TOP_K = 20
+
+_METADATA_KEYS = ("domain", "created_at", "version")
+
+def _read_metadata(graph_file: Path) -> dict:
+    """Stream the top-level metadata fields, stopping once all are found."""
+    metadata = {}
+    with open(graph_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in _METADATA_KEYS and event in ("string", "number", "boolean", "null"):
+                metadata[prefix] = value
+                if len(metadata) == len(_METADATA_KEYS):
+                    break
+    return metadata
 
 def view_knowledge_graph():
     """Load and display the pre-built knowledge graph."""
@@ -23,63 +42,85 @@ def view_knowledge_graph():
         return
     
     print(f"📊 Loading knowledge graph from: {graph_file}")
-    with open(graph_file, 'r') as f:
-        kg_data = json.load(f)
+    # The file is streamed (metadata, then nodes, then edges) so only the
+    # running statistics, the top-K heap and the sample edges stay in memory
+    metadata = _read_metadata(graph_file)
     
     # Display metadata
     print("\n" + "=" * 60)
     print("📋 Knowledge Graph Metadata")
     print("=" * 60)
-    print(f"Domain: {kg_data.get('domain', 'N/A')}")
-    print(f"Created: {kg_data.get('created_at', 'N/A')}")
-    print(f"Version: {kg_data.get('version', 'N/A')}")
+    print(f"Domain: {metadata.get('domain', 'N/A')}")
+    print(f"Created: {metadata.get('created_at', 'N/A')}")
+    print(f"Version: {metadata.get('version', 'N/A')}")
+    
+    # One streaming pass over the nodes: centrality statistics plus a bounded min-heap of the top K
+    top_nodes = []
+    node_count = 0
+    highest, lowest, total = float('-inf'), float('inf'), 0.0
+    with open(graph_file, 'rb') as f:
+        for node in ijson.items(f, 'nodes.item', use_float=True):
+            centrality = node.get('centrality_score', 0)
+            highest = max(highest, centrality)
+            lowest = min(lowest, centrality)
+            total += centrality
+            # node_count breaks score ties so the node dicts are never compared
+            entry = (centrality, -node_count, node)
+            if len(top_nodes) < TOP_K:
+                heapq.heappush(top_nodes, entry)
+            elif entry > top_nodes[0]:
+                heapq.heapreplace(top_nodes, entry)
+            node_count += 1
     
     # Display nodes
-    nodes = kg_data.get('nodes', [])
     print("\n" + "=" * 60)
-    print(f"📊 Nodes ({len(nodes)} total)")
+    print(f"📊 Nodes ({node_count} total)")
     print("=" * 60)
     
-    # Sort nodes by centrality
-    sorted_nodes = sorted(nodes, key=lambda x: x.get('centrality_score', 0), reverse=True)
-    
-    print("\nTop Nodes (by Centrality):")
-    for i, node in enumerate(sorted_nodes, 1):
-        centrality = node.get('centrality_score', 0)
+    print(f"\nTop Nodes (by Centrality, showing up to {TOP_K}):")
+    for i, (centrality, _, node) in enumerate(sorted(top_nodes, reverse=True), 1):
         node_id = node.get('id', 'N/A')
         node_type = node.get('node_type', 'N/A')
         print(f"  {i:2d}. {node_id:30s} (centrality: {centrality:.4f}, type: {node_type})")
     
+    if node_count > TOP_K:
+        print(f"\n  ... and {node_count - TOP_K} more nodes")
+    
+    # One streaming pass over the edges: counts per source node and per edge type, plus the samples
+    edge_counts = defaultdict(int)
+    edge_types = defaultdict(int)
+    sample_edges = []
+    edge_count = 0
+    with open(graph_file, 'rb') as f:
+        for edge in ijson.items(f, 'edges.item', use_float=True):
+            edge_counts[edge.get('source', 'N/A')] += 1
+            edge_types[edge.get('edge_type', 'related_to')] += 1
+            if edge_count < 10:
+                sample_edges.append(edge)
+            edge_count += 1
+    
     # Display edges
-    edges = kg_data.get('edges', [])
     print("\n" + "=" * 60)
-    print(f"🔗 Edges ({len(edges)} total)")
+    print(f"🔗 Edges ({edge_count} total)")
     print("=" * 60)
     
-    # Count edges per source node
-    edge_counts = defaultdict(int)
-    for edge in edges:
-        source = edge.get('source', 'N/A')
-        edge_counts[source] += 1
-    
-    print("\nTop Connected Nodes:")
-    sorted_connections = sorted(edge_counts.items(), key=lambda x: x[1], reverse=True)
-    for node, count in sorted_connections:
+    print(f"\nTop Connected Nodes (showing up to {TOP_K}):")
+    for node, count in heapq.nlargest(TOP_K, edge_counts.items(), key=itemgetter(1)):
         print(f"  {node:30s} ({count} connections)")
     
     # Show sample edges
     print("\n" + "-" * 60)
     print("Sample Edges (showing first 10):")
     print("-" * 60)
-    for i, edge in enumerate(edges[:10], 1):
+    for i, edge in enumerate(sample_edges, 1):
         source = edge.get('source', 'N/A')
         target = edge.get('target', 'N/A')
         edge_type = edge.get('edge_type', 'related_to')
         weight = edge.get('weight', 1.0)
         print(f"  {i:2d}. {source:25s} --[{edge_type}]--> {target:25s} (weight: {weight:.2f})")
     
-    if len(edges) > 10:
-        print(f"\n  ... and {len(edges) - 10} more edges")
+    if edge_count > 10:
+        print(f"\n  ... and {edge_count - 10} more edges")
     
     # Network statistics
     print("\n" + "=" * 60)
@@ -87,28 +128,24 @@ def view_knowledge_graph():
     print("=" * 60)
     
     # Calculate average degree
-    if nodes:
-        avg_degree = len(edges) * 2 / len(nodes)
+    if node_count:
+        avg_degree = edge_count * 2 / node_count
         print(f"Average Degree (connections per node): {avg_degree:.2f}")
     
-    # Find nodes with highest centrality
-    centrality_scores = [node.get('centrality_score', 0) for node in nodes]
-    if centrality_scores:
-        print(f"Highest Centrality: {max(centrality_scores):.4f}")
-        print(f"Lowest Centrality: {min(centrality_scores):.4f}")
-        print(f"Average Centrality: {sum(centrality_scores)/len(centrality_scores):.4f}")
+    # Centrality range (accumulated in the node pass above)
+    if node_count:
+        print(f"Highest Centrality: {highest:.4f}")
+        print(f"Lowest Centrality: {lowest:.4f}")
+        print(f"Average Centrality: {total/node_count:.4f}")
     
     # Find most connected nodes
-    print(f"\nMost Connected Node: {sorted_connections[0][0]} ({sorted_connections[0][1]} connections)")
-    
-    # Edge type distribution
-    edge_types = defaultdict(int)
-    for edge in edges:
-        edge_type = edge.get('edge_type', 'related_to')
-        edge_types[edge_type] += 1
+    if edge_counts:
+        most_connected, connections = max(edge_counts.items(), key=itemgetter(1))
+        print(f"\nMost Connected Node: {most_connected} ({connections} connections)")
     
+    # Edge type distribution (counted with the connections above)
     print("\nEdge Type Distribution:")
-    for edge_type, count in sorted(edge_types.items(), key=lambda x: x[1], reverse=True):
+    for edge_type, count in sorted(edge_types.items(), key=itemgetter(1), reverse=True):
         print(f"  {edge_type:20s}: {count} edges")
 
 if __name__ == "__main__":
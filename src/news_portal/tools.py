@@ -1,22 +1,106 @@
 import re
 import json
 import os
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+import httpx
 import requests
 import feedparser
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import trafilatura
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import List, Dict, FrozenSet, Optional, Tuple
 
-from langchain_community.utilities.google_serper import GoogleSerperAPIWrapper
-from langchain_community.document_loaders import WebBaseLoader
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
+from w3lib.url import canonicalize_url, url_query_cleaner
 
 
-def _serper() -> GoogleSerperAPIWrapper:
-    # Reads SERPER_API_KEY from env.
-    # k=20 fetches a larger pool; we dedupe & trim later.
-    return GoogleSerperAPIWrapper(type="news", k=20, gl="us", hl="en")
+SERPER_NEWS_URL = "https://google.serper.dev/news"
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """Keep-alive session shared by every Serper call, so queries reuse pooled connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, allowed_methods=None),  # search POSTs are safe to retry
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _serper_results(q: str, api_key: str) -> Dict:
+    # num=20 fetches a larger pool; we dedupe & trim later.
+    response = _http_session().post(
+        SERPER_NEWS_URL,
+        headers={"X-API-KEY": api_key},
+        json={"q": q, "gl": "us", "hl": "en", "num": 20},
+        timeout=10,
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 # ---------- Alternative News Sources ----------
+FETCH_WORKERS = 8  # concurrent feed/subreddit fetches
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+async def _download_feeds(feed_urls: List[str]) -> List[Optional[bytes]]:
+    """Download all feeds concurrently; None for any that fail."""
+    async def download(client: httpx.AsyncClient, feed_url: str) -> Optional[bytes]:
+        try:
+            response = await client.get(feed_url)
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            print(f"⚠️ RSS feed {feed_url} failed: {e}")
+            return None
+    
+    async with httpx.AsyncClient(timeout=10, follow_redirects=True, headers={"User-Agent": "NewsPortal/1.0"}) as client:
+        return await asyncio.gather(*(download(client, feed_url) for feed_url in feed_urls))
+
+
+def _parse_feed_articles(feed_url: str, data: Optional[bytes], query_terms: FrozenSet[str]) -> List[Dict]:
+    """Parse one downloaded RSS feed and keep the entries sharing a word with the query."""
+    if data is None:
+        return []
+    try:
+        feed = feedparser.parse(data)
+        articles = []
+        for entry in feed.entries[:5]:  # Limit per feed
+            # Check if article matches query (one tokenization per entry, then a set test)
+            words = set(_WORD_RE.findall(entry.get("title", "").lower()))
+            words.update(_WORD_RE.findall(entry.get("summary", "").lower()))
+            
+            if not query_terms.isdisjoint(words):
+                articles.append({
+                    "title": entry.get("title", "").strip(),
+                    "url": entry.get("link", "").strip(),
+                    "source": feed.feed.get("title", "RSS Feed"),
+                    "published_date": datetime(*entry.get("published_parsed", (2024, 1, 1, 0, 0, 0, 0, 1, 0))[:6]).strftime("%Y-%m-%d") if entry.get("published_parsed") else None,
+                })
+        return articles
+    except Exception as e:
+        print(f"⚠️ RSS feed {feed_url} failed: {e}")
+        return []
+
+
 def fetch_rss_articles(query: str) -> List[Dict]:
     """Fetch articles from RSS feeds"""
     try:
@@ -28,27 +112,14 @@ def fetch_rss_articles(query: str) -> List[Dict]:
             "https://www.nih.gov/news-events/news-releases/rss",
             "https://www.cancer.gov/news-events/rss",
         ]
+        query_terms = frozenset(_WORD_RE.findall(query.lower()))
         
+        # Download every feed concurrently, then parse the payloads on a thread pool (map keeps feed order)
+        payloads = asyncio.run(_download_feeds(rss_feeds))
         articles = []
-        for feed_url in rss_feeds:
-            try:
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries[:5]:  # Limit per feed
-                    # Check if article matches query
-                    title_lower = entry.get("title", "").lower()
-                    summary_lower = entry.get("summary", "").lower()
-                    query_lower = query.lower()
-                    
-                    if any(term in title_lower or term in summary_lower for term in query_lower.split()):
-                        articles.append({
-                            "title": entry.get("title", "").strip(),
-                            "url": entry.get("link", "").strip(),
-                            "source": feed.feed.get("title", "RSS Feed"),
-                            "published_date": datetime(*entry.get("published_parsed", (2024, 1, 1, 0, 0, 0, 0, 1, 0))[:6]).strftime("%Y-%m-%d") if entry.get("published_parsed") else None,
-                        })
-            except Exception as e:
-                print(f"⚠️ RSS feed {feed_url} failed: {e}")
-                continue
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            for feed_articles in executor.map(_parse_feed_articles, rss_feeds, payloads, [query_terms] * len(rss_feeds)):
+                articles.extend(feed_articles)
         
         return articles
     except Exception as e:
@@ -56,37 +127,52 @@ def fetch_rss_articles(query: str) -> List[Dict]:
         return []
 
 
+async def _download_subreddits(subreddits: List[str]) -> List[Optional[Dict]]:
+    """Download every subreddit's hot posts over one pooled HTTP/2 connection; None for any that fail."""
+    async def download(client: httpx.AsyncClient, subreddit: str) -> Optional[Dict]:
+        try:
+            response = await client.get(f"https://www.reddit.com/r/{subreddit}/hot.json?limit=10")
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            print(f"⚠️ Reddit r/{subreddit} failed: {e}")
+            return None
+    
+    # All requests go to the same host, so HTTP/2 multiplexes them over a single TLS connection
+    async with httpx.AsyncClient(http2=True, timeout=10, follow_redirects=True, headers={"User-Agent": "NewsPortal/1.0"}) as client:
+        return await asyncio.gather(*(download(client, subreddit) for subreddit in subreddits))
+
+
+def _parse_subreddit_articles(subreddit: str, data: Optional[Dict], query_terms: List[str]) -> List[Dict]:
+    """Keep the downloaded subreddit posts matching any query term."""
+    if data is None:
+        return []
+    articles = []
+    for post in data.get("data", {}).get("children", []):
+        post_data = post.get("data", {})
+        title = post_data.get("title", "")
+        
+        # Check if post matches query
+        if any(term in title.lower() for term in query_terms):
+            articles.append({
+                "title": f"[Reddit] {title}",
+                "url": f"https://reddit.com{post_data.get('permalink', '')}",
+                "source": f"r/{subreddit}",
+                "published_date": datetime.fromtimestamp(post_data.get("created_utc", 0)).strftime("%Y-%m-%d"),
+            })
+    return articles
+
+
 def fetch_reddit_articles(query: str) -> List[Dict]:
     """Fetch articles from Reddit (discussions about news)"""
     try:
         # Reddit doesn't require API key for basic requests
         subreddits = ["science", "medicine", "cancer", "oncology", "healthcare"]
-        articles = []
+        query_terms = query.lower().split()
         
-        for subreddit in subreddits:
-            try:
-                url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=10"
-                headers = {"User-Agent": "NewsPortal/1.0"}
-                
-                response = requests.get(url, headers=headers, timeout=10)
-                response.raise_for_status()
-                
-                data = response.json()
-                for post in data.get("data", {}).get("children", []):
-                    post_data = post.get("data", {})
-                    title = post_data.get("title", "")
-                    
-                    # Check if post matches query
-                    if any(term in title.lower() for term in query.lower().split()):
-                        articles.append({
-                            "title": f"[Reddit] {title}",
-                            "url": f"https://reddit.com{post_data.get('permalink', '')}",
-                            "source": f"r/{subreddit}",
-                            "published_date": datetime.fromtimestamp(post_data.get("created_utc", 0)).strftime("%Y-%m-%d"),
-                        })
-            except Exception as e:
-                print(f"⚠️ Reddit r/{subreddit} failed: {e}")
-                continue
+        articles = []
+        for subreddit, data in zip(subreddits, asyncio.run(_download_subreddits(subreddits))):
+            articles.extend(_parse_subreddit_articles(subreddit, data, query_terms))
         
         return articles
     except Exception as e:
@@ -94,66 +180,114 @@ def fetch_reddit_articles(query: str) -> List[Dict]:
         return []
 
 
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = ("utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "fbclid", "gclid")
+
+
+@lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """Canonical form of a URL for deduplication: tracking params dropped, query sorted, fragment removed."""
+    if not url:
+        return ""
+    try:
+        return canonicalize_url(url_query_cleaner(url, TRACKING_PARAMS, remove=True)).casefold()
+    except Exception:
+        return url.casefold()
+
+
+def _dedupe_by_url(items: List[Dict], limit: Optional[int] = None) -> List[Dict]:
+    """Keep the first item per canonical URL, skipping items without a title or URL."""
+    out, seen = [], set()
+    for it in items:
+        url = _canonical_url(it["url"])
+        if it["title"] and url and url not in seen:
+            seen.add(url)
+            out.append(it)
+            if limit is not None and len(out) >= limit:
+                break
+    return out
+
+
 def fetch_multiple_sources(query: str) -> List[Dict]:
     """Fetch articles from multiple sources as fallback"""
     print(f"🔄 Trying multiple news sources for: {query}")
     
-    all_articles = []
-    
-    # Try RSS feeds
-    rss_articles = fetch_rss_articles(query)
-    all_articles.extend(rss_articles)
+    # Try RSS feeds and Reddit at the same time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rss_future = executor.submit(fetch_rss_articles, query)
+        reddit_future = executor.submit(fetch_reddit_articles, query)
+        rss_articles = rss_future.result()
+        reddit_articles = reddit_future.result()
     print(f"📰 RSS Feeds: {len(rss_articles)} articles")
-    
-    # Try Reddit
-    reddit_articles = fetch_reddit_articles(query)
-    all_articles.extend(reddit_articles)
     print(f"📰 Reddit: {len(reddit_articles)} articles")
     
+    all_articles = rss_articles + reddit_articles
+    
     # Deduplicate
-    seen = set()
-    unique_articles = []
-    for article in all_articles:
-        key = (article["title"].lower(), article["url"].lower())
-        if key not in seen and article["title"] and article["url"]:
-            seen.add(key)
-            unique_articles.append(article)
+    unique_articles = _dedupe_by_url(all_articles)
     
     print(f"📊 Total unique articles: {len(unique_articles)}")
     return unique_articles
 
 
-def _iso_date_from_result(obj: dict) -> Optional[str]:
+_ISO_PREFIX_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_AGO_RE = re.compile(r"(\d+)\s+(day|hour|minute)s?\s+ago")
+_UNIT_SECONDS = {"minute": 60, "hour": 3600, "day": 86400}
+
+
+def _iso_date_from_result(obj: dict, now: Optional[datetime] = None) -> Optional[str]:
     dt = obj.get("date") or obj.get("publishedDate")
     if not dt:
         return None
-    if isinstance(dt, str) and re.match(r"^\d{4}-\d{2}-\d{2}", dt):
+    if isinstance(dt, str) and _ISO_PREFIX_RE.match(dt):
         return dt[:10]
     try:
-        m = re.match(r"(\d+)\s+(day|hour|minute)s?\s+ago", (dt or "").lower())
+        m = _AGO_RE.match((dt or "").lower())
         if m:
             val, unit = int(m.group(1)), m.group(2)
-            delta = {"minute": timedelta(minutes=val), "hour": timedelta(hours=val), "day": timedelta(days=val)}[unit]
-            return (datetime.utcnow() - delta).strftime("%Y-%m-%d")
+            return ((now or datetime.now(timezone.utc)) - timedelta(seconds=val * _UNIT_SECONDS[unit])).strftime("%Y-%m-%d")
     except Exception:
         pass
     return None
 
 
+# Recent search results by normalized query. days_hint is not part of the key:
+# no date filter is sent to any source, so both fetch passes get the same results.
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=512, ttl=600)
+_SEARCH_CACHE_LOCK = threading.Lock()  # subtopics search from worker threads
+
+
 def news_search(query: str, days_hint: int = 21) -> List[Dict]:
-    """Search recent news via multiple sources with fallback."""
+    """Search recent news via multiple sources with fallback (cached for 10 minutes)."""
+    key = query.lower().strip()
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+    
+    results = _news_search_uncached(query)
+    if results:
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[key] = results
+    return list(results)
+
+
+def prefetch_news_searches(queries: List[str], days_hint: int = 21) -> None:
+    """Run the searches for many queries concurrently to warm the news_search cache."""
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        list(executor.map(news_search, dict.fromkeys(queries), [days_hint] * len(queries)))
+
+
+def _news_search_uncached(query: str) -> List[Dict]:
     all_items = []
     
     # Try Serper first (if API key available)
     try:
-        wrapper = _serper()
-        # Use more specific time-based queries and add randomization
-        import random
-        from datetime import datetime
-        
-        # Add current date and randomization to make queries more unique
+        api_key = os.getenv("SERPER_API_KEY")
+        if not api_key:
+            raise RuntimeError("SERPER_API_KEY is not set")
+        # Add the current date to make queries more specific
         current_date = datetime.now().strftime("%Y-%m-%d")
-        random_suffix = random.randint(1, 1000)
         
         # Try multiple query variations for better results
         query_variations = [
@@ -163,21 +297,28 @@ def news_search(query: str, days_hint: int = 21) -> List[Dict]:
             f"{query} breaking news"
         ]
         
-        for q in query_variations[:2]:  # Use first 2 variations to avoid rate limits
+        def run_query(q: str) -> List[Dict]:
             try:
-                raw = wrapper.results(q)
-                items = []
-                for obj in raw.get("news", []) + raw.get("organic", []):
-                    items.append({
-                        "title": (obj.get("title") or "").strip(),
-                        "url": (obj.get("link") or obj.get("url") or "").strip(),
-                        "source": (obj.get("source") or obj.get("publisher") or "").strip(),
-                        "published_date": _iso_date_from_result(obj),
-                    })
-                all_items.extend(items)
+                raw = _serper_results(q, api_key)
             except Exception as e:
                 print(f"⚠️ Serper query failed: {q} - {e}")
-                continue
+                return []
+            now = datetime.now(timezone.utc)  # one clock read for every relative date in the response
+            return [
+                {
+                    "title": (obj.get("title") or "").strip(),
+                    "url": (obj.get("link") or obj.get("url") or "").strip(),
+                    "source": (obj.get("source") or obj.get("publisher") or "").strip(),
+                    "published_date": _iso_date_from_result(obj, now),
+                }
+                for obj in raw.get("news", []) + raw.get("organic", [])
+            ]
+        
+        # Use first 2 variations to avoid rate limits; they are sent concurrently
+        selected = query_variations[:2]
+        with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+            for items in executor.map(run_query, selected):
+                all_items.extend(items)
                 
         if all_items:
             print(f"✅ Serper found {len(all_items)} articles")
@@ -190,52 +331,194 @@ def news_search(query: str, days_hint: int = 21) -> List[Dict]:
         print("🔄 Using alternative news sources...")
         all_items = fetch_multiple_sources(query)
     
-    # Deduplicate by (title,url)
-    out, seen = [], set()
-    for it in all_items:
-        key = (it["title"].lower(), it["url"].lower())
-        if it["title"] and it["url"] and key not in seen:
-            seen.add(key)
-            out.append(it)
-    return out
+    # Deduplicate by URL
+    return _dedupe_by_url(all_items)
 
 
-def scrape_article(url: str) -> str:
-    """Scrape article text; returns '' on failure."""
+# ---------- Article scraping ----------
+SCRAPE_MAX_CHARS = 20000  # cap safety
+SCRAPE_CONCURRENCY = 16   # parallel fetches in flight, so no host gets hammered
+SCRAPE_TIMEOUT = 10.0
+SCRAPE_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; NewsPortal/1.0)"}
+SCRAPE_CACHE_PATH = Path("~/.cache/news_portal/scraped_articles.sqlite").expanduser()
+SCRAPE_CACHE_TTL_SECONDS = 7 * 24 * 3600  # article pages rarely change after publication
+
+
+def _html_to_text(html: str) -> str:
+    """Main article text of an HTML page; falls back to all visible text when no article body is found."""
+    text = trafilatura.extract(html, include_comments=False, favor_precision=True)
+    if text:
+        return text
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style", "noscript"])
+    body = tree.body
+    return body.text(separator="\n", strip=True) if body is not None else ""
+
+
+def _scrape_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=SCRAPE_TIMEOUT,
+        follow_redirects=True,
+        headers=SCRAPE_HEADERS,
+        limits=httpx.Limits(max_connections=32),
+    )
+
+
+async def _scrape_one(client: httpx.AsyncClient, url: str) -> str:
     try:
-        loader = WebBaseLoader([url])
-        docs = loader.load()
-        return "\n\n".join(d.page_content for d in docs)[:20000]  # cap safety
+        response = await client.get(url)
+        response.raise_for_status()
+        return _html_to_text(response.text)[:SCRAPE_MAX_CHARS]
     except Exception:
         return ""
 
 
+async def _scrape_worker(client: httpx.AsyncClient, queue: asyncio.Queue, pages: Dict[str, str]) -> None:
+    """Scrape URLs taken from the queue into pages until a None sentinel arrives."""
+    while (url := await queue.get()) is not None:
+        pages[url] = await _scrape_one(client, url)
+
+
+async def _scrape_all(urls: List[str]) -> List[str]:
+    """Fetch and extract all URLs with SCRAPE_CONCURRENCY workers; '' for any that fail."""
+    queue: asyncio.Queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    for _ in range(SCRAPE_CONCURRENCY):
+        queue.put_nowait(None)
+    
+    pages: Dict[str, str] = {}
+    async with _scrape_client() as client:
+        await asyncio.gather(*(_scrape_worker(client, queue, pages) for _ in range(SCRAPE_CONCURRENCY)))
+    return [pages[url] for url in urls]
+
+
+def _scrape_cache_key(url: str) -> str:
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _scrape_cache_connect() -> sqlite3.Connection:
+    SCRAPE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(SCRAPE_CACHE_PATH, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, fetched_at REAL, content BLOB)")
+    return conn
+
+
+def _scrape_cache_get_many(urls: List[str]) -> Dict[str, str]:
+    """Cached page text for the URLs scraped within the TTL (zlib-compressed on disk)."""
+    keys = {_scrape_cache_key(url): url for url in urls}
+    try:
+        with closing(_scrape_cache_connect()) as conn:
+            rows = conn.execute(
+                f"SELECT key, content FROM pages WHERE fetched_at >= ? AND key IN ({','.join('?' * len(keys))})",
+                (time.time() - SCRAPE_CACHE_TTL_SECONDS, *keys),
+            ).fetchall()
+        return {keys[key]: zlib.decompress(content).decode("utf-8") for key, content in rows}
+    except (sqlite3.Error, zlib.error) as e:
+        print(f"⚠️ Scrape cache read failed: {e}")
+        return {}
+
+
+def _scrape_cache_put_many(pages: Dict[str, str]) -> None:
+    now = time.time()
+    try:
+        with closing(_scrape_cache_connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO pages (key, fetched_at, content) VALUES (?, ?, ?)",
+                [(_scrape_cache_key(url), now, zlib.compress(text.encode("utf-8"))) for url, text in pages.items()],
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ Scrape cache write failed: {e}")
+
+
+def _scrape_urls(urls: List[str]) -> List[str]:
+    """Page text for each URL, from the on-disk cache or fetched concurrently; '' on failure."""
+    if not urls:
+        return []
+    pages = _scrape_cache_get_many(urls)
+    missing = [url for url in dict.fromkeys(urls) if url not in pages]
+    if missing:
+        # Only successful scrapes are cached, so failures are retried next run
+        fetched = {url: text for url, text in zip(missing, asyncio.run(_scrape_all(missing))) if text}
+        if fetched:
+            _scrape_cache_put_many(fetched)
+        pages.update(fetched)
+    return [pages.get(url, "") for url in urls]
+
+
+def scrape_article(url: str) -> str:
+    """Scrape article text; returns '' on failure."""
+    return _scrape_urls([url])[0]
+
+
+async def _search_and_scrape(queries: List[str], want: int, days_first: int, days_second: int) -> List[Dict]:
+    """Run the searches and scrape their results as they arrive, so search and scrape time overlap."""
+    cap = want * 2
+    queue: asyncio.Queue = asyncio.Queue(maxsize=cap)
+    picked: List[Tuple[Tuple[int, int, int], Dict]] = []  # (pass, query, rank) keeps the sequential order
+    pages: Dict[str, str] = {}
+    fetched: Dict[str, str] = {}
+    seen = set()
+    
+    async def search(qi: int, q: str, days_hint: int):
+        return qi, await asyncio.to_thread(news_search, q, days_hint)
+    
+    async def produce():
+        found = 0
+        for pass_no, days_hint in enumerate((days_first, days_second)):
+            # PASS 2 only if the fresh window came up short
+            if pass_no and found >= want:
+                return
+            # Searches finish in any order, but results are picked in query order so the
+            # selection (and de-duplication) matches a sequential run; early finishers wait here
+            arrived: Dict[int, List[Dict]] = {}
+            next_qi = 0
+            for next_done in asyncio.as_completed([search(qi, q, days_hint) for qi, q in enumerate(queries)]):
+                qi, items = await next_done
+                found += len(items)
+                arrived[qi] = items
+                batch = []
+                while next_qi in arrived and len(picked) < cap:
+                    for rank, it in enumerate(arrived.pop(next_qi)):
+                        if len(picked) >= cap:
+                            break
+                        key = _canonical_url(it["url"])
+                        if it["title"] and key and key not in seen:
+                            seen.add(key)
+                            picked.append(((pass_no, next_qi, rank), it))
+                            batch.append(it["url"])
+                    next_qi += 1
+                if batch:
+                    # Cached pages are used as-is; only the rest go to the scrape workers
+                    pages.update(await asyncio.to_thread(_scrape_cache_get_many, batch))
+                    for url in batch:
+                        if url not in pages:
+                            await queue.put(url)
+                if len(picked) >= cap:
+                    return
+    
+    async with _scrape_client() as client:
+        workers = [asyncio.create_task(_scrape_worker(client, queue, fetched)) for _ in range(SCRAPE_CONCURRENCY)]
+        try:
+            await produce()
+        finally:
+            for _ in workers:
+                await queue.put(None)
+        await asyncio.gather(*workers)
+    
+    # Only successful scrapes are cached, so failures are retried next run
+    fetched = {url: text for url, text in fetched.items() if text}
+    if fetched:
+        await asyncio.to_thread(_scrape_cache_put_many, fetched)
+    pages.update(fetched)
+    
+    picked.sort(key=itemgetter(0))
+    return [{**it, "content": pages.get(it["url"], "")} for _, it in picked]
+
+
 def fetch_articles_with_content(queries: List[str], want: int, days_first=21, days_second=60) -> List[Dict]:
-    """Multi-pass: fresh window then extended; returns items with 'content' field."""
-    # PASS 1
-    found = []
-    for q in queries:
-        found.extend(news_search(q, days_hint=days_first))
-    # PASS 2 if needed
-    if len(found) < want:
-        for q in queries:
-            found.extend(news_search(q, days_hint=days_second))
-
-    # de-dupe, build a pool
-    pool, seen = [], set()
-    for it in found:
-        key = (it["title"].lower(), it["url"].lower())
-        if it["title"] and it["url"] and key not in seen:
-            seen.add(key)
-            pool.append(it)
-        if len(pool) >= max(want * 3, want):
-            break
-
-    # scrape top pool
-    out = []
-    for it in pool[:max(want * 2, want)]:
-        content = scrape_article(it["url"])
-        it2 = dict(it)
-        it2["content"] = content
-        out.append(it2)
-    return out
+    """Multi-pass: fresh window then extended; returns items with 'content' field.
+    
+    Scraping starts as soon as the first search returns and overlaps the remaining searches.
+    """
+    return asyncio.run(_search_and_scrape(queries, want, days_first, days_second))
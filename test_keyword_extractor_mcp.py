@@ -7,7 +7,7 @@ Tests the keyword extractor tool through the FastMCP server.
 """
 
 import asyncio
-import json
+import orjson
 import sys
 from pathlib import Path
 
@@ -19,11 +19,15 @@ load_dotenv()
 
 def parse_fastmcp_result(result):
     """Parse FastMCP result and return as dictionary."""
+    # Dict-returning tools also send structured content, already decoded by the client
+    structured = getattr(result, 'structured_content', None)
+    if isinstance(structured, dict):
+        return structured
     if hasattr(result, 'content') and result.content:
         result_data = result.content[0].text
         try:
-            return json.loads(result_data)
-        except json.JSONDecodeError:
+            return orjson.loads(result_data)
+        except orjson.JSONDecodeError:
             return {"status": "error", "message": f"Could not parse JSON: {result_data}"}
     else:
         return {"status": "error", "message": "No content in result"}
@@ -0,0 +1,39 @@
+"""
+Hard time limit for the full-pipeline runs in the tests.
+
+A hung LLM or search backend would otherwise block a test forever, since
+the tests only see exceptions that are actually raised.
+"""
+
+import os
+import threading
+
+# Seconds a single run_graph call may take before the test fails
+RUN_GRAPH_TIMEOUT = int(os.getenv("RUN_GRAPH_TIMEOUT", "180"))
+
+def run_with_deadline(func, *args, seconds: float = RUN_GRAPH_TIMEOUT, **kwargs):
+    """
+    Return func(*args, **kwargs), raising TimeoutError if it takes longer than `seconds`.
+    
+    The call runs in a daemon thread that is joined with a timeout, so the limit
+    holds even while the call is stuck in a socket read or C code that a signal
+    would never interrupt, and on any platform or thread. A call that times out
+    is abandoned and dies with the test process.
+    """
+    outcome = {}
+    
+    def target():
+        try:
+            outcome["result"] = func(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+    
+    name = getattr(func, "__name__", "call")
+    thread = threading.Thread(target=target, name=f"deadline-{name}", daemon=True)
+    thread.start()
+    thread.join(seconds)
+    if thread.is_alive():
+        raise TimeoutError(f"{name} timed out after {seconds}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
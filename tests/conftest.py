@@ -0,0 +1,114 @@
+"""
+Shared pytest fixtures for the news portal tests.
+
+The full pipeline and the news search hit live LLM and search APIs. To keep
+test runs fast and repeatable, their results are recorded once and replayed:
+
+- `graph_result` loads `fixtures/graph_n1.json` when it exists, then falls back to
+  the last run for the current source tree in the pytest cache dir.
+- `cassette` replays HTTP traffic from `cassettes/` via vcrpy.
+
+The recordings are not committed, so tests that need a missing one are skipped.
+Pass `--record` to call the live APIs for whatever is missing and record it, or
+`--live` to ignore the recordings and re-record everything.
+"""
+
+import hashlib
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+
+import orjson
+import pytest
+
+try:
+    from ._timeout import run_with_deadline
+except ImportError:
+    from _timeout import run_with_deadline
+
+logger = logging.getLogger(__name__)
+
+TESTS_DIR = Path(__file__).resolve().parent
+SRC_DIR = TESTS_DIR.parent / "src" / "news_portal"
+FIXTURES_DIR = TESTS_DIR / "fixtures"
+CASSETTES_DIR = TESTS_DIR / "cassettes"
+GRAPH_FIXTURE = FIXTURES_DIR / "graph_n1.json"
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--record",
+        action="store_true",
+        default=False,
+        help="Call the live APIs for missing fixtures and cassettes and record them",
+    )
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Call the live APIs and re-record the fixtures and cassettes",
+    )
+
+def _source_fingerprint() -> str:
+    """Hash of every news_portal source file's path, size and mtime; changes whenever the code does."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(SRC_DIR.rglob("*.py")):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(SRC_DIR)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+@pytest.fixture(scope="session")
+def graph_result(request):
+    """Run the full news portal graph once per test session (or replay a recorded/cached run)."""
+    live = request.config.getoption("--live")
+    record = live or request.config.getoption("--record")
+    
+    if GRAPH_FIXTURE.exists() and not live:
+        logger.info("📼 Replaying recorded graph result from %s", GRAPH_FIXTURE)
+        return orjson.loads(GRAPH_FIXTURE.read_bytes())
+    
+    # Unchanged code gives the same pipeline, so reuse the last run from the pytest cache dir
+    news_article_count = 1  # Use minimal articles per subtopic
+    cache_file = request.config.cache.mkdir("news_portal") / f"graph_{_source_fingerprint()}_{news_article_count}.json"
+    if cache_file.exists() and not live:
+        logger.info("📦 Reusing cached graph result from %s", cache_file)
+        return orjson.loads(cache_file.read_bytes())
+    
+    if not record:
+        pytest.skip(f"No recorded graph result at {GRAPH_FIXTURE}; run with --record to record one")
+    
+    from news_portal.graph import run_graph
+    
+    logger.info("🚀 Running optimized graph with news_article_count=%d (shared by all tests)...", news_article_count)
+    result = run_with_deadline(run_graph, news_article_count=news_article_count)
+    
+    cache_file.write_bytes(orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS))
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    GRAPH_FIXTURE.write_bytes(orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    logger.info("💾 Recorded graph result to %s", GRAPH_FIXTURE)
+    return result
+
+@pytest.fixture
+def cassette(request):
+    """Return a context manager factory that records/replays HTTP traffic for a named cassette."""
+    import vcr
+    
+    live = request.config.getoption("--live")
+    record = live or request.config.getoption("--record")
+    
+    recorder = vcr.VCR(
+        cassette_library_dir=str(CASSETTES_DIR),
+        # Plain runs only replay: a request missing from the cassette fails instead of going live
+        record_mode="all" if live else "new_episodes" if record else "none",
+        # Never write API keys into the cassettes
+        filter_headers=["X-API-KEY", "authorization"],
+        filter_query_parameters=["api_key", "apiKey"],
+    )
+    
+    @contextmanager
+    def use(name: str, **kwargs):
+        if not record and not (CASSETTES_DIR / name).exists():
+            pytest.skip(f"No recorded cassette {CASSETTES_DIR / name}; run with --record to record it")
+        with recorder.use_cassette(name, **kwargs):
+            yield
+    
+    return use
@@ -0,0 +1,85 @@
+"""
+Pipeline Benchmarks
+
+Statistical timings of both pipelines with pytest-benchmark. All HTTP
+traffic (search, scraping and LLM calls) is replayed from a VCR cassette,
+so the numbers measure our code rather than the network.
+
+Opt in with RUN_PERF=1, and compare against a saved baseline:
+
+    RUN_PERF=1 uv run pytest tests/test_bench.py --benchmark-autosave
+    RUN_PERF=1 uv run pytest tests/test_bench.py --benchmark-compare=0001 --benchmark-compare-fail=mean:15%
+"""
+
+import logging
+import os
+
+import pytest
+
+try:
+    from ._timeout import RUN_GRAPH_TIMEOUT, run_with_deadline
+except ImportError:
+    from _timeout import RUN_GRAPH_TIMEOUT, run_with_deadline
+
+logger = logging.getLogger(__name__)
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(os.getenv("RUN_PERF") != "1", reason="benchmarks the full pipeline; set RUN_PERF=1 to opt in"),
+]
+
+ROUNDS = 5
+
+# LLM requests share a URL, so replay has to match on the request body as well
+MATCH_ON = ("method", "scheme", "host", "port", "path", "query", "body")
+
+def _cold_caches(tmp_path_factory, monkeypatch):
+    """
+    Return a setup callable that gives every round cold caches, so all rounds do the same work.
+    
+    In-memory caches are cleared; on-disk caches (scraped pages, LLM responses,
+    generated images, the cover manifest) are pointed at a fresh directory.
+    """
+    from news_portal import mcp_client_service, tools
+    from news_portal.mcp_tools.mcp_tools_base import Config
+    
+    def setup():
+        cache_dir = tmp_path_factory.mktemp("bench_cache")
+        with tools._SEARCH_CACHE_LOCK:
+            tools._SEARCH_CACHE.clear()
+        mcp_client_service.invalidate_glossary()
+        monkeypatch.setattr(tools, "SCRAPE_CACHE_PATH", cache_dir / "scraped_articles.sqlite")
+        monkeypatch.setattr(mcp_client_service, "COVER_MANIFEST_FILE", cache_dir / "cover_manifest.json")
+        monkeypatch.setattr(Config, "LLM_CACHE_PATH", str(cache_dir / "llm_responses.sqlite"))
+        monkeypatch.setattr(Config, "IMAGE_CACHE_PATH", str(cache_dir / "generated_images.sqlite"))
+    
+    return setup
+
+def _bench_pipeline(benchmark, cassette, setup, name, run):
+    # One run_graph time limit per round, warmup included
+    with cassette(name, match_on=MATCH_ON):
+        result = run_with_deadline(
+            benchmark.pedantic,
+            run,
+            kwargs={"news_article_count": 1},
+            setup=setup,
+            rounds=ROUNDS,
+            iterations=1,
+            warmup_rounds=1,
+            seconds=(ROUNDS + 1) * RUN_GRAPH_TIMEOUT,
+        )
+    logger.info("📊 %s: %d subtopics processed", name, len(result.get("final", {}).get("per_subtopic", {})))
+
+def test_bench_original(benchmark, cassette, tmp_path_factory, monkeypatch):
+    """Benchmark the original graph."""
+    from news_portal.graph import run_graph
+    
+    setup = _cold_caches(tmp_path_factory, monkeypatch)
+    _bench_pipeline(benchmark, cassette, setup, "bench_original.yaml", run_graph)
+
+def test_bench_optimized(benchmark, cassette, tmp_path_factory, monkeypatch):
+    """Benchmark the optimized graph."""
+    graph_optimized = pytest.importorskip("news_portal.graph_optimized")
+    
+    setup = _cold_caches(tmp_path_factory, monkeypatch)
+    _bench_pipeline(benchmark, cassette, setup, "bench_optimized.yaml", graph_optimized.run_optimized_graph)
@@ -1,129 +1,132 @@
 #!/usr/bin/env python3
 """
-Performance Comparison Script
+Performance Comparison
 
-This script compares the performance between the original and optimized versions
+Compares the performance between the original and optimized versions
 of the news portal processing.
 """
 
+import importlib
+import logging
+import os
 import time
-import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-# Add the src directory to the Python path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+import pytest
 
-def test_original_performance():
-    """Test the original graph performance."""
-    print("=" * 60)
-    print("🐌 Testing ORIGINAL Performance")
-    print("=" * 60)
-    
-    try:
-        from news_portal.graph import run_graph
-        
-        start_time = time.time()
-        result = run_graph(news_article_count=1)  # Use minimal articles for testing
-        end_time = time.time()
-        
-        duration = end_time - start_time
-        print(f"✅ Original processing completed in {duration:.2f} seconds")
-        
-        # Count articles processed
-        total_articles = 0
-        for subtopic_data in result.get("final", {}).get("per_subtopic", {}).values():
-            total_articles += len(subtopic_data.get("articles", []))
-        
-        print(f"📊 Processed {total_articles} articles")
-        print(f"⏱️  Average time per article: {duration/max(total_articles, 1):.2f} seconds")
-        
-        return duration, total_articles
-        
-    except Exception as e:
-        print(f"❌ Original test failed: {e}")
-        return None, 0
+try:
+    from ._timeout import run_with_deadline
+except ImportError:
+    from _timeout import run_with_deadline
 
-def test_optimized_performance():
-    """Test the optimized graph performance."""
-    print("\n" + "=" * 60)
-    print("🚀 Testing OPTIMIZED Performance")
-    print("=" * 60)
-    
-    try:
-        from news_portal.graph_optimized import run_optimized_graph
-        
-        start_time = time.time()
-        result = run_optimized_graph(news_article_count=1)  # Use minimal articles for testing
-        end_time = time.time()
-        
-        duration = end_time - start_time
-        print(f"✅ Optimized processing completed in {duration:.2f} seconds")
-        
-        # Count articles processed
-        total_articles = 0
-        for subtopic_data in result.get("final", {}).get("per_subtopic", {}).values():
-            total_articles += len(subtopic_data.get("articles", []))
-        
-        print(f"📊 Processed {total_articles} articles")
-        print(f"⏱️  Average time per article: {duration/max(total_articles, 1):.2f} seconds")
-        
-        return duration, total_articles
-        
-    except Exception as e:
-        print(f"❌ Optimized test failed: {e}")
-        return None, 0
+logger = logging.getLogger(__name__)
+
+def _count_articles(result) -> int:
+    """Total number of articles across all subtopics."""
+    return sum(len(sd.get("articles", ())) for sd in result.get("final", {}).get("per_subtopic", {}).values())
 
-def main():
-    """Main performance comparison."""
-    print("Performance Comparison: Original vs Optimized")
-    print("This will test both versions with minimal article count for speed")
+def _warm_imports():
+    """Import the pipeline package before any timer starts, so neither arm pays cold-import cost."""
+    importlib.import_module("news_portal.graph")
+
+def _run_original():
+    """Time the original graph; returns (seconds, articles)."""
+    logger.info("=" * 60)
+    logger.info("🐌 Testing ORIGINAL Performance")
+    logger.info("=" * 60)
+    
+    from news_portal.graph import run_graph
     
-    # Test original
-    original_time, original_articles = test_original_performance()
+    start_time = time.perf_counter()
+    result = run_with_deadline(run_graph, news_article_count=1)  # Use minimal articles for testing
+    end_time = time.perf_counter()
     
-    # Test optimized
-    optimized_time, optimized_articles = test_optimized_performance()
+    duration = end_time - start_time
+    logger.info("✅ Original processing completed in %.2f seconds", duration)
+    
+    # Count articles processed
+    total_articles = _count_articles(result)
+    
+    logger.info("📊 Processed %d articles", total_articles)
+    logger.info("⏱️  Average time per article: %.2f seconds", duration/max(total_articles, 1))
+    
+    return duration, total_articles
+
+def _run_optimized():
+    """Time the optimized graph; returns (seconds, articles)."""
+    logger.info("\n" + "=" * 60)
+    logger.info("🚀 Testing OPTIMIZED Performance")
+    logger.info("=" * 60)
+    
+    from news_portal.graph_optimized import run_optimized_graph
+    
+    start_time = time.perf_counter()
+    result = run_with_deadline(run_optimized_graph, news_article_count=1)  # Use minimal articles for testing
+    end_time = time.perf_counter()
+    
+    duration = end_time - start_time
+    logger.info("✅ Optimized processing completed in %.2f seconds", duration)
+    
+    # Count articles processed
+    total_articles = _count_articles(result)
+    
+    logger.info("📊 Processed %d articles", total_articles)
+    logger.info("⏱️  Average time per article: %.2f seconds", duration/max(total_articles, 1))
+    
+    return duration, total_articles
+
+@pytest.mark.slow
+@pytest.mark.skipif(os.getenv("RUN_PERF") != "1", reason="runs the full pipeline twice; set RUN_PERF=1 to opt in")
+def test_performance_comparison():
+    """Compare the original and optimized pipelines."""
+    # The optimized pipeline is not part of every checkout; without it there is nothing to compare
+    pytest.importorskip("news_portal.graph_optimized")
+    
+    logger.info("Performance Comparison: Original vs Optimized")
+    logger.info("This will test both versions with minimal article count for speed")
+    
+    # Both arms are network/LLM-bound and independent, so run them side by side.
+    # Separate processes keep the in-memory search caches from leaking between arms.
+    # The arms compete for the same OpenAI/Serper rate limits, network and CPU, so each
+    # timing is inflated by the other and the comparison is indicative only; use
+    # tests/test_bench.py for a statistically sound comparison.
+    # Each worker imports the pipeline package before taking an arm, keeping import cost out of the timings.
+    # An arm that raises re-raises here through result(), failing the test with its traceback.
+    with ProcessPoolExecutor(max_workers=2, initializer=_warm_imports) as executor:
+        original_future = executor.submit(_run_original)
+        optimized_future = executor.submit(_run_optimized)
+        original_time, original_articles = original_future.result()
+        optimized_time, optimized_articles = optimized_future.result()
     
     # Compare results
-    print("\n" + "=" * 60)
-    print("📊 PERFORMANCE COMPARISON")
-    print("=" * 60)
+    logger.info("\n" + "=" * 60)
+    logger.info("📊 PERFORMANCE COMPARISON")
+    logger.info("=" * 60)
     
-    if original_time and optimized_time:
-        speedup = original_time / optimized_time
-        time_saved = original_time - optimized_time
-        
-        print(f"Original Time:    {original_time:.2f} seconds")
-        print(f"Optimized Time:   {optimized_time:.2f} seconds")
-        print(f"Time Saved:       {time_saved:.2f} seconds")
-        print(f"Speedup:          {speedup:.1f}x faster")
-        print(f"Articles (Orig):  {original_articles}")
-        print(f"Articles (Opt):   {optimized_articles}")
-        
-        if speedup > 1:
-            print(f"\n🎉 SUCCESS: Optimized version is {speedup:.1f}x faster!")
-        else:
-            print(f"\n⚠️  Optimized version is {1/speedup:.1f}x slower")
-            
-        # Estimate full processing time
-        estimated_original_full = original_time * 2  # Assuming 2 articles per subtopic
-        estimated_optimized_full = optimized_time * 2
-        
-        print(f"\n📈 ESTIMATED FULL PROCESSING TIME:")
-        print(f"Original (2 articles/subtopic):  {estimated_original_full:.1f} seconds ({estimated_original_full/60:.1f} minutes)")
-        print(f"Optimized (2 articles/subtopic):  {estimated_optimized_full:.1f} seconds ({estimated_optimized_full/60:.1f} minutes)")
-        
-        if estimated_optimized_full < 60:
-            print("🎯 GOAL ACHIEVED: Optimized version completes in under 1 minute!")
-        else:
-            print("🎯 GOAL: Still working towards under 1 minute completion")
+    speedup = original_time / optimized_time
+    time_saved = original_time - optimized_time
+    
+    logger.info("Original Time:    %.2f seconds", original_time)
+    logger.info("Optimized Time:   %.2f seconds", optimized_time)
+    logger.info("Time Saved:       %.2f seconds", time_saved)
+    logger.info("Speedup:          %.1fx faster", speedup)
+    logger.info("Articles (Orig):  %s", original_articles)
+    logger.info("Articles (Opt):   %s", optimized_articles)
     
+    if speedup > 1:
+        logger.info("\n🎉 SUCCESS: Optimized version is %.1fx faster!", speedup)
     else:
-        print("❌ Could not complete performance comparison")
-        return 1
+        logger.warning("\n⚠️  Optimized version is %.1fx slower", 1/speedup)
+        
+    # Estimate full processing time
+    estimated_original_full = original_time * 2  # Assuming 2 articles per subtopic
+    estimated_optimized_full = optimized_time * 2
     
-    return 0
-
-if __name__ == "__main__":
-    sys.exit(main())
+    logger.info("\n📈 ESTIMATED FULL PROCESSING TIME:")
+    logger.info("Original (2 articles/subtopic):  %.1f seconds (%.1f minutes)", estimated_original_full, estimated_original_full/60)
+    logger.info("Optimized (2 articles/subtopic):  %.1f seconds (%.1f minutes)", estimated_optimized_full, estimated_optimized_full/60)
+    
+    if estimated_optimized_full < 60:
+        logger.info("🎯 GOAL ACHIEVED: Optimized version completes in under 1 minute!")
+    else:
+        logger.info("🎯 GOAL: Still working towards under 1 minute completion")